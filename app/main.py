@@ -1,66 +1,343 @@
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import (
+    Blueprint, Flask, Request, Response, current_app, g, request, jsonify, send_from_directory, stream_with_context
+)
+import argparse
+import io
+import json
 import os
-from braille.braille_converter import make_braille_image, text_to_braille, decode_braille_image
+import signal
+import time
+from contextlib import ExitStack
+from braille.braille_converter import (
+    encode_braille_image, sanitize_filename, text_to_braille, decode_braille_image
+)
+from braille.braille_audit import AuditLog
+from braille.braille_cache import RenderCache, render_cache_key
+from braille.braille_jobs import JobPool, JobQueueFull, JobTimeout
+from braille import braille_metrics as metrics
+from braille.braille_svg import SVG_MIMETYPE
+from braille.braille_translator import reload_tables
 from werkzeug.utils import secure_filename
 
-app = Flask(__name__)
-UPLOAD_FOLDER = './uploads'
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+IMAGE_CACHE_CONTROL = "public, max-age=86400"
+# 이미지 엔드포인트 응답 포맷 (format 파라미터 또는 Accept 헤더로 선택, 기본 PNG)
+IMAGE_FORMATS = {"png": (".png", "image/png"), "svg": (".svg", SVG_MIMETYPE)}
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/jsonl")
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+# 작업 대기열이 가득 찼을 때 클라이언트에 알려줄 재시도 대기 시간(초)
+RETRY_AFTER = 1
+
+bp = Blueprint("braille", __name__)
+
+def default_config():
+    """환경 변수 기반 기본 설정"""
+    return {
+        # 요청 본문 최대 크기(바이트): 넘으면 본문을 읽기 전에 413 (업로드 이미지는 메모리에서 바로 디코딩)
+        'MAX_CONTENT_LENGTH': int(os.environ.get("BRAILLE_MAX_UPLOAD_BYTES", 16 * 1024 * 1024)),
+        # 생성 이미지 디스크 보관 폴더 (미설정 시 저장하지 않고 메모리에서 바로 응답)
+        'IMAGE_SAVE_FOLDER': os.environ.get("BRAILLE_IMAGE_SAVE_DIR"),
+        # 렌더링 결과 캐시 (메모리 LRU 바이트 한도, 디스크 계층 폴더는 선택)
+        'CACHE_MAX_BYTES': int(os.environ.get("BRAILLE_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        'CACHE_DIR': os.environ.get("BRAILLE_CACHE_DIR"),
+        # 복원 기록 감사 로그 (JSONL 세그먼트 폴더, 세그먼트 최대 크기)
+        'AUDIT_DIR': os.environ.get("BRAILLE_AUDIT_DIR", "data/audit"),
+        'AUDIT_SEGMENT_BYTES': int(os.environ.get("BRAILLE_AUDIT_SEGMENT_BYTES", 64 * 1024 * 1024)),
+        # 배치 변환 요청 1건당 최대 항목 수
+        'MAX_BATCH_SIZE': int(os.environ.get("BRAILLE_MAX_BATCH_SIZE", 10000)),
+        # 렌더링/복원 작업 풀: 프로세스 수(0이면 요청 스레드에서 실행, 제한 시간 미적용), 대기열 한도, 작업당 제한 시간(초)
+        'JOB_WORKERS': int(os.environ["BRAILLE_WORKERS"]) if "BRAILLE_WORKERS" in os.environ else None,
+        'JOB_MAX_QUEUE': int(os.environ["BRAILLE_MAX_QUEUE"]) if "BRAILLE_MAX_QUEUE" in os.environ else None,
+        'JOB_TIMEOUT': float(os.environ.get("BRAILLE_JOB_TIMEOUT", 30)),
+        # 단계별 소요 시간을 응답 Server-Timing 헤더로 노출 (기본 끔)
+        'SERVER_TIMING': os.environ.get("BRAILLE_SERVER_TIMING", "0") == "1",
+        # 샘플링 프로파일러: 렌더링/복원 작업 중 이 비율만 cProfile로 측정해 PROFILE_DIR에 .prof 저장 (기본 0 = 끔)
+        'PROFILE_SAMPLE_RATE': float(os.environ.get("BRAILLE_PROFILE_RATE", 0)),
+        'PROFILE_DIR': os.environ.get("BRAILLE_PROFILE_DIR", "data/profiles"),
+    }
+
+class MemoryUploadRequest(Request):
+    """
+    업로드 파일을 크기와 관계없이 메모리(BytesIO)에 받는 요청 클래스.
+    Werkzeug 기본값은 500KB를 넘는 파일을 임시 파일에 쓰지만, 본문 크기는 MAX_CONTENT_LENGTH로 먼저 제한되므로
+    메모리에 받아 그대로 cv2.imdecode에 넘김 (디스크 왕복 없음)
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return io.BytesIO()
+
+def create_app(config=None):
+    """앱 팩토리: 설정(dict)으로 기본 설정을 덮어쓰고 캐시/작업 풀을 앱마다 생성"""
+    app = Flask(__name__)
+    app.request_class = MemoryUploadRequest
+    app.config.update(default_config())
+    if config:
+        app.config.update(config)
+    app.extensions['render_cache'] = RenderCache(
+        max_bytes=app.config['CACHE_MAX_BYTES'], disk_dir=app.config['CACHE_DIR'],
+    )
+    app.extensions['job_pool'] = JobPool(
+        workers=app.config['JOB_WORKERS'],
+        max_queue=app.config['JOB_MAX_QUEUE'],
+        timeout=app.config['JOB_TIMEOUT'],
+    )
+    app.extensions['audit_log'] = AuditLog(
+        app.config['AUDIT_DIR'], max_segment_bytes=app.config['AUDIT_SEGMENT_BYTES'],
+    )
+    app.extensions['profiler'] = metrics.ProfileSampler(
+        app.config['PROFILE_SAMPLE_RATE'], app.config['PROFILE_DIR'],
+    )
+    app.register_blueprint(bp)
+    return app
+
+def run_job(fn, *args, **kwargs):
+    """
+    CPU 작업을 앱의 작업 풀에서 실행 (대기열 초과/시간 초과는 아래 에러 핸들러가 응답).
+    작업 프로세스의 단계별 계측 기록은 결과와 함께 받아 현재 요청 기록에 합침.
+    """
+    profiler = current_app.extensions['profiler']
+    profile = profiler.should_sample()
+    result, records, stats = current_app.extensions['job_pool'].run(
+        metrics.call_recorded, fn, args, kwargs, profile
+    )
+    metrics.replay(records)
+    if stats is not None:
+        profiler.hook(request.endpoint or fn.__name__, stats)
+    return result
+
+@bp.before_app_request
+def start_request_metrics():
+    g.metrics_start = time.perf_counter()
+    g.metrics_stack = ExitStack()
+    g.metrics_records = g.metrics_stack.enter_context(metrics.recording())
+
+@bp.after_app_request
+def add_request_metrics(resp):
+    records = g.get("metrics_records")
+    if records is not None:
+        endpoint = request.endpoint or "unknown"
+        metrics.REGISTRY.inc(
+            "braille_http_requests_total", (("endpoint", endpoint), ("status", str(resp.status_code))),
+            help="엔드포인트/상태 코드별 요청 수",
+        )
+        metrics.REGISTRY.observe(
+            "braille_http_request_seconds", (("endpoint", endpoint),), time.perf_counter() - g.metrics_start,
+            help="엔드포인트별 요청 처리 시간(초)",
+        )
+        if current_app.config['SERVER_TIMING'] and records:
+            resp.headers["Server-Timing"] = metrics.server_timing(records)
+    return resp
+
+@bp.teardown_app_request
+def finish_request_metrics(exc):
+    # 스트리밍 응답은 본문 생성이 끝난 뒤 호출되므로 생성 중 기록까지 포함
+    stack = g.pop("metrics_stack", None)
+    if stack is not None:
+        stack.close()
+        metrics.commit(g.pop("metrics_records"))
+
+@bp.app_errorhandler(JobQueueFull)
+def handle_job_queue_full(e):
+    resp = jsonify({"error": f"서버가 바쁩니다. 잠시 후 다시 시도하세요 ({e})"})
+    resp.status_code = 503
+    resp.headers["Retry-After"] = str(RETRY_AFTER)
+    return resp
+
+@bp.app_errorhandler(413)
+def handle_request_too_large(e):
+    limit = current_app.config['MAX_CONTENT_LENGTH']
+    return jsonify({"error": f"업로드 최대 크기({limit} bytes) 초과"}), 413
+
+@bp.app_errorhandler(JobTimeout)
+def handle_job_timeout(e):
+    return jsonify({"error": f"처리 시간 초과 ({current_app.config['JOB_TIMEOUT']:g}초)"}), 504
+
+@bp.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (프로세스 단위: 여러 프로세스로 실행 시 프로세스마다 따로 집계)"""
+    return Response(metrics.REGISTRY.render(), mimetype=PROMETHEUS_MIMETYPE)
 
 # 루트 health check 및 index.html 제공
-@app.route("/", methods=["GET"])
+@bp.route("/", methods=["GET"])
 def root():
     # index.html이 같은 디렉토리에 있을 경우
     if os.path.exists("index.html"):
         return send_from_directory(".", "index.html")
     return "Braille Web Demo is running!"
 
-@app.route("/api/text-to-braille-image", methods=["POST"])
+def _negotiate_image_format(requested):
+    """format 파라미터("png"/"svg")가 있으면 우선, 없으면 Accept 헤더로 선택 -> (확장자, MIME). 잘못된 값은 None"""
+    if requested:
+        return IMAGE_FORMATS.get(requested.lower())
+    mimetypes = [mimetype for _, mimetype in IMAGE_FORMATS.values()]
+    best = request.accept_mimetypes.best_match(mimetypes, default="image/png")
+    return next(fmt for fmt in IMAGE_FORMATS.values() if fmt[1] == best)
+
+@bp.route("/api/text-to-braille-image", methods=["GET", "POST"])
 def api_text_to_braille_image():
-    data = request.json
-    text = data.get("text", "")
+    # GET: ?text=... (브라우저/프록시 캐시 및 조건부 요청용), POST: JSON 본문
+    if request.method == "POST":
+        data = request.json
+        text = data.get("text", "")
+        requested = data.get("format")
+    else:
+        text = request.args.get("text", "")
+        requested = request.args.get("format")
     if not text:
         return jsonify({"error": "텍스트 입력 필요"}), 400
-    img_path, cell_count = make_braille_image(text)
-    return send_file(img_path, mimetype="image/png")
+    fmt = _negotiate_image_format(requested)
+    if fmt is None:
+        return jsonify({"error": f"지원하지 않는 포맷: {requested} (png, svg)"}), 400
+    ext, mimetype = fmt
+    key = render_cache_key(text, ext=ext)
+    # 조건부 GET: 같은 입력이면 렌더링 없이 304
+    if request.method == "GET" and key in request.if_none_match:
+        resp = Response(status=304)
+    else:
+        def render():
+            save_path = None
+            save_folder = current_app.config['IMAGE_SAVE_FOLDER']
+            if save_folder:
+                os.makedirs(save_folder, exist_ok=True)
+                filename = os.path.splitext(sanitize_filename(text))[0] + ext
+                save_path = os.path.join(save_folder, filename)
+            data, cell_count = run_job(encode_braille_image, text, ext=ext, save_path=save_path)
+            return data
+        render_cache = current_app.extensions['render_cache']
+        resp = Response(render_cache.get_or_render(key, render), mimetype=mimetype)
+    resp.set_etag(key)
+    resp.headers["Cache-Control"] = IMAGE_CACHE_CONTROL
+    resp.vary.add("Accept")
+    return resp
 
-@app.route("/api/text-to-braille-unicode", methods=["POST"])
+@bp.route("/api/text-to-braille-unicode", methods=["POST"])
 def api_text_to_braille_unicode():
     data = request.json
     text = data.get("text", "")
     if not text:
         return jsonify({"error": "텍스트 입력 필요"}), 400
-    braille_unicode = text_to_braille(text, use_unicode=True)
+    with metrics.span("translate"):
+        braille_unicode = text_to_braille(text, use_unicode=True)
+    metrics.observe("cells", len(braille_unicode))
     return jsonify({"braille_unicode": braille_unicode})
 
-@app.route('/api/braille-image-to-text', methods=['POST'])
+def _batch_item_text(item):
+    """배치 항목(문자열, {"text": ...}, 또는 NDJSON 원시 줄) -> 텍스트. 잘못된 항목은 ValueError"""
+    if isinstance(item, bytes):
+        try:
+            item = json.loads(item)
+        except ValueError:
+            raise ValueError("잘못된 JSON 줄")
+    if isinstance(item, dict):
+        item = item.get("text")
+    if not isinstance(item, str):
+        raise ValueError("text는 문자열이어야 함")
+    if not item:
+        raise ValueError("텍스트 입력 필요")
+    return item
+
+def _ndjson(obj):
+    return json.dumps(obj, ensure_ascii=False) + "\n"
+
+@bp.route("/api/text-to-braille-unicode/batch", methods=["POST"])
+def api_text_to_braille_unicode_batch():
+    """
+    여러 텍스트 일괄 변환. 결과는 항목별 NDJSON 줄로 순서대로 스트리밍.
+    - 입력: JSON 배열 / {"texts": [...]} / NDJSON(줄마다 문자열 또는 {"text": ...})
+    - 출력: {"index": i, "braille_unicode": ...} 또는 {"index": i, "error": ...}
+    """
+    max_batch = current_app.config['MAX_BATCH_SIZE']
+    if request.mimetype in NDJSON_MIMETYPES:
+        # 요청 본문을 줄 단위로 읽으며 바로 변환 (전체 본문을 메모리에 올리지 않음)
+        items = (line for line in request.stream if line.strip())
+    else:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            data = data.get("texts")
+        if not isinstance(data, list):
+            return jsonify({"error": "texts 배열 또는 NDJSON 입력 필요"}), 400
+        if len(data) > max_batch:
+            return jsonify({"error": f"배치 최대 크기({max_batch}) 초과"}), 413
+        items = iter(data)
+
+    def generate():
+        for index, item in enumerate(items):
+            if index >= max_batch:
+                yield _ndjson({"index": index, "error": f"배치 최대 크기({max_batch}) 초과, 이후 항목 무시"})
+                break
+            try:
+                text = _batch_item_text(item)
+                with metrics.span("translate"):
+                    braille_unicode = text_to_braille(text, use_unicode=True)
+                yield _ndjson({"index": index, "braille_unicode": braille_unicode})
+            except Exception as e:
+                yield _ndjson({"index": index, "error": str(e)})
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+@bp.route('/api/braille-image-to-text', methods=['POST'])
 def api_braille_image_to_text():
     if 'file' not in request.files:
         return jsonify({"error": "이미지 파일 업로드 필요"}), 400
     file = request.files['file']
     filename = secure_filename(file.filename)
-    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(file_path)
+    data = file.read()
+    if not data:
+        return jsonify({"error": "빈 이미지 파일"}), 400
     try:
-        text = decode_braille_image(file_path)
-        # 변환 정보 저장 (예: data/restore_20240527_000000.json)
-        import json
-        from datetime import datetime
-        os.makedirs("data", exist_ok=True)
-        info = {
-            "restored_text": text,
-            "input_image": filename,
-            "restored_at": datetime.now().isoformat()
-        }
-        info_filename = f"restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(os.path.join("data", info_filename), "w", encoding="utf-8") as f:
-            json.dump(info, f, ensure_ascii=False, indent=2)
+        # 디스크에 저장하지 않고 업로드 바이트를 그대로 작업 풀에 넘겨 cv2.imdecode로 복원
+        text = run_job(decode_braille_image, data)
+        # 변환 정보는 감사 로그 큐에만 넣고 파일 기록은 백그라운드 스레드가 모아서 처리
+        current_app.extensions['audit_log'].record("restore", restored_text=text, input_image=filename)
         return jsonify({'text': text})
+    except (JobQueueFull, JobTimeout):
+        raise
+    except ValueError as e:
+        # 이미지로 디코딩할 수 없는 업로드
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# `flask --app main run` 등 모듈 수준 앱을 찾는 실행 방식 호환용
+app = create_app()
+
+def reload_braille_tables(app, path=None):
+    """
+    점자 테이블 재로드 (재시작 없음): 요청 프로세스의 테이블을 교체하고 작업 풀을 새로 만들어
+    이후 작업은 새 테이블을 읽은 작업자에서 실행. 렌더링 캐시 키에 테이블 버전이 포함되어 이전 결과는 재사용되지 않음
+    """
+    version = reload_tables(path)
+    app.extensions['job_pool'].restart()
+    app.logger.info("점자 테이블 재로드: %s", version)
+    return version
+
+def serve(app, host="0.0.0.0", port=5000, threads=8):
+    """
+    운영용 실행: waitress가 설치되어 있으면 waitress(스레드 수 고정), 없으면 werkzeug 멀티스레드 서버.
+    CPU 작업은 어느 쪽이든 작업 풀에서 실행되고 요청 스레드는 결과만 기다림.
+    gunicorn 사용 시: gunicorn -w 1 --threads 8 -b 0.0.0.0:5000 "main:create_app()"
+    """
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        from werkzeug.serving import run_simple
+        run_simple(host, port, app, threaded=True)
+    else:
+        waitress_serve(app, host=host, port=port, threads=threads)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점자 변환 웹 데모 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 5000)))
+    parser.add_argument("--prod", action="store_true", help="개발 서버 대신 운영용 서버로 실행")
+    parser.add_argument("--threads", type=int, default=8, help="운영용 서버 요청 처리 스레드 수")
+    args = parser.parse_args(argv)
+    if hasattr(signal, "SIGHUP"):
+        # kill -HUP <pid>: data/braille_table.bin(또는 BRAILLE_TABLE) 다시 로드
+        signal.signal(signal.SIGHUP, lambda signum, frame: reload_braille_tables(app))
+    if args.prod:
+        serve(app, args.host, args.port, args.threads)
+    else:
+        app.run(host=args.host, port=args.port)
+
 if __name__ == "__main__":
-    import os
-    port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port)
\ No newline at end of file
+    main()
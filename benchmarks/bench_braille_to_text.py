@@ -0,0 +1,112 @@
+"""
+braille_to_text 복원 처리량 벤치마크: 테이블 기반 상태 머신 vs 이전 딕셔너리/hgtk 구현
+실행: python -m benchmarks.bench_braille_to_text [셀 수 ...]
+"""
+
+import random
+import sys
+import time
+
+import hgtk
+from braille.braille_table import (
+    INITIAL_TO_BRAILLE, MEDIAL_TO_BRAILLE, FINAL_TO_BRAILLE,
+    HANGUL_BRAILLE_ABBREVIATION, ENGLISH_TO_BRAILLE, SPECIAL_TO_BRAILLE,
+    CAPITAL_PREFIX, NUMBER_PREFIX, NUM_TO_BRAILLE_LETTER,
+)
+from braille.braille_translator import (
+    bits_to_mask, unicode_to_cells, text_to_braille, braille_to_text
+)
+
+# --- 이전 구현 (셀마다 딕셔너리 조회 + 역방향 선형 탐색 + hgtk.letter.compose) ---
+_INITIAL = {bits_to_mask(v): k for k, v in INITIAL_TO_BRAILLE.items()}
+_MEDIAL = {bits_to_mask(v): k for k, v in MEDIAL_TO_BRAILLE.items()}
+_FINAL = {bits_to_mask(v): k for k, v in FINAL_TO_BRAILLE.items() if not isinstance(v[0], list)}
+_ABBREVIATION = {bits_to_mask(v): k for k, v in HANGUL_BRAILLE_ABBREVIATION.items()}
+_ENGLISH = {bits_to_mask(v): k for k, v in ENGLISH_TO_BRAILLE.items()}
+_SPECIAL = {bits_to_mask(v): k for k, v in SPECIAL_TO_BRAILLE.items()}
+_CAPITAL = bits_to_mask(CAPITAL_PREFIX)
+_NUMBER = bits_to_mask(NUMBER_PREFIX)
+
+def reference_braille_to_text(braille):
+    cells = unicode_to_cells(braille)
+    result = []
+    i = 0
+    n = len(cells)
+    while i < n:
+        c = cells[i]
+        abbr_matched = False
+        for k, v in _ABBREVIATION.items():
+            if c == k:
+                result.append(v)
+                i += 1
+                abbr_matched = True
+                break
+        if abbr_matched:
+            continue
+        if i+2 < n:
+            ini = _INITIAL.get(c)
+            med = _MEDIAL.get(cells[i+1])
+            if ini and med is not None:
+                jong = _FINAL.get(cells[i+2], '')
+                try:
+                    char = hgtk.letter.compose(ini, med, jong)
+                except Exception:
+                    char = '?'
+                result.append(char)
+                i += 3
+                continue
+        if c == _CAPITAL and i+1 < n:
+            result.append(_ENGLISH.get(cells[i+1], '?').upper())
+            i += 2
+            continue
+        if c == _NUMBER:
+            num = []
+            idx = i + 1
+            while idx < n:
+                digit_ch = _ENGLISH.get(cells[idx])
+                if digit_ch and digit_ch in NUM_TO_BRAILLE_LETTER.values():
+                    for k, v in NUM_TO_BRAILLE_LETTER.items():
+                        if v == digit_ch:
+                            num.append(k)
+                            break
+                else:
+                    break
+                idx += 1
+            result.append(''.join(num))
+            i = idx
+            continue
+        ch = _ENGLISH.get(c) or _SPECIAL.get(c)
+        result.append(ch if ch else (' ' if c == 0 else '?'))
+        i += 1
+    return ''.join(result)
+
+def make_sample(ncells, seed=0):
+    """한글/영문/숫자/특수문자 혼합 텍스트를 점자로 변환해 약 ncells 셀 분량의 유니코드 점자 생성"""
+    rnd = random.Random(seed)
+    words = ["안녕하세요", "점자", "닭갈비", "그래서", "Braille", "abc", "2025", "3.14", "!", "?"]
+    parts = []
+    size = 0
+    while size < ncells:
+        braille = text_to_braille(rnd.choice(words) + " ")
+        parts.append(braille)
+        size += len(braille)
+    return ''.join(parts)
+
+def bench(fn, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+if __name__ == "__main__":
+    sizes = [int(x) for x in sys.argv[1:]] or [1_000, 100_000, 1_000_000]
+    print(f"{'cells':>10} {'reference(s)':>14} {'table(s)':>10} {'Mcell/s':>8} {'speedup':>8}")
+    for ncells in sizes:
+        braille = make_sample(ncells)
+        assert reference_braille_to_text(braille) == braille_to_text(braille)
+        t_ref = bench(reference_braille_to_text, braille)
+        t_new = bench(braille_to_text, braille)
+        print(f"{len(braille):>10} {t_ref:>14.4f} {t_new:>10.4f} "
+              f"{len(braille) / t_new / 1e6:>8.2f} {t_ref / t_new:>7.1f}x")
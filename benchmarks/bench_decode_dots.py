@@ -0,0 +1,68 @@
+"""
+decode_braille_image 점 위치 조회 단계 스케일링 벤치마크: 점유 마스크 O(1) 조회 vs 이전 선형 탐색
+실행: python -m benchmarks.bench_decode_dots [셀 수 ...]
+"""
+
+import sys
+import time
+
+import cv2
+
+from braille.braille_renderer import DOT_COORDS, cell_geometry, render_braille_cells
+from braille.braille_decoder import (
+    detect_dot_centers, expected_dot_positions, dot_occupancy_mask, lookup_dots, hits_to_cells
+)
+from braille.braille_translator import unicode_to_cells
+from benchmarks.bench_braille_to_text import make_sample
+
+# 이전 구현은 (셀 * 6 * 점 개수)에 비례하므로 이 값을 넘으면 측정 생략
+REFERENCE_MAX_OPS = 3e9
+
+def reference_lookup(centers, gray_shape, geometry, max_cols):
+    """이전 구현: 기대 위치마다 전체 점 중심 목록을 any()로 선형 탐색"""
+    centers = [tuple(c) for c in centers.tolist()]
+    img_h, img_w = gray_shape
+    ncol = min(max_cols, img_w // geometry.cell_w)
+    nrow = img_h // geometry.cell_h
+    dot_r = geometry.point_r
+    patterns = bytearray()
+    for row in range(nrow):
+        for col in range(ncol):
+            x0 = col * geometry.cell_w + geometry.cell_w // 2 - geometry.xgap // 2
+            y0 = row * geometry.cell_h + geometry.cell_h // 2 - geometry.ygap
+            mask = 0
+            for idx, (dx, dy) in enumerate(DOT_COORDS):
+                cx = int(round(x0 + dx * geometry.xgap))
+                cy = int(round(y0 + dy * geometry.ygap))
+                if any(abs(cx - x) <= dot_r and abs(cy - y) <= dot_r for (x, y) in centers):
+                    mask |= 1 << idx
+            patterns.append(mask)
+    return bytes(patterns).rstrip(b'\x00')
+
+def occupancy_lookup(centers, gray_shape, geometry, max_cols):
+    img_h, img_w = gray_shape
+    ncol = min(max_cols, img_w // geometry.cell_w)
+    nrow = img_h // geometry.cell_h
+    cx, cy = expected_dot_positions(nrow, ncol, geometry)
+    mask = dot_occupancy_mask(centers, gray_shape, geometry.point_r)
+    return hits_to_cells(lookup_dots(mask, cx, cy, geometry.point_r))
+
+if __name__ == "__main__":
+    sizes = [int(x) for x in sys.argv[1:]] or [500, 2_000, 8_000, 32_000]
+    geometry = cell_geometry(150)
+    max_cols = 40
+    print(f"{'cells':>8} {'dots':>8} {'reference(s)':>13} {'occupancy(s)':>13} {'speedup':>8}")
+    for ncells in sizes:
+        cells = unicode_to_cells(make_sample(ncells))
+        gray = cv2.cvtColor(render_braille_cells(cells, geometry, max_cols), cv2.COLOR_BGR2GRAY)
+        centers = detect_dot_centers(gray, geometry.point_r)
+        t0 = time.perf_counter()
+        fast = occupancy_lookup(centers, gray.shape, geometry, max_cols)
+        t_fast = time.perf_counter() - t0
+        if len(cells) * 6 * len(centers) <= REFERENCE_MAX_OPS:
+            t0 = time.perf_counter()
+            assert reference_lookup(centers, gray.shape, geometry, max_cols) == fast
+            t_ref = time.perf_counter() - t0
+            print(f"{len(cells):>8} {len(centers):>8} {t_ref:>13.3f} {t_fast:>13.4f} {t_ref / t_fast:>7.0f}x")
+        else:
+            print(f"{len(cells):>8} {len(centers):>8} {'(skipped)':>13} {t_fast:>13.4f} {'-':>8}")
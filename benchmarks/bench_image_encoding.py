@@ -0,0 +1,56 @@
+"""
+점자 이미지 렌더링 모드/인코딩 포맷별 크기 vs 시간 벤치마크
+- 모드: bgr(3채널), gray(단일 채널), bilevel(1비트)
+- 포맷: PNG(압축 레벨별), WebP 무손실, TIFF(단일 채널은 Deflate, bilevel은 1비트 패킹)
+실행: python -m benchmarks.bench_image_encoding [셀 수] [dpi]
+"""
+
+import sys
+import time
+
+from braille.braille_renderer import cell_geometry, render_braille_cells, encode_braille_raster
+from braille.braille_translator import unicode_to_cells
+from benchmarks.bench_braille_to_text import make_sample
+
+CASES = [
+    # (모드, 포맷, 압축 레벨)
+    ("bgr", ".png", None),
+    ("bgr", ".png", 1),
+    ("bgr", ".png", 9),
+    ("gray", ".png", None),
+    ("gray", ".png", 1),
+    ("gray", ".png", 9),
+    ("bilevel", ".png", None),
+    ("bilevel", ".png", 1),
+    ("bilevel", ".png", 9),
+    ("bgr", ".webp", None),
+    ("gray", ".webp", None),
+    ("bgr", ".tiff", None),
+    ("gray", ".tiff", None),
+    ("bilevel", ".tiff", None),
+    ("bilevel", ".tiff", 9),
+]
+
+def best_time(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+if __name__ == "__main__":
+    ncells = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    dpi = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    geometry = cell_geometry(dpi)
+    cells = unicode_to_cells(make_sample(ncells))
+    print(f"{len(cells)} cells, {dpi} dpi")
+    print(f"{'mode':>8} {'format':>6} {'level':>5} {'render(ms)':>11} {'encode(ms)':>11} {'bytes':>10} {'vs bgr png':>10}")
+    baseline = None
+    for mode, ext, level in CASES:
+        t_render, img = best_time(lambda: render_braille_cells(cells, geometry, 20, mode))
+        t_encode, data = best_time(lambda: encode_braille_raster(img, ext, level, mode == "bilevel", dpi))
+        if baseline is None:
+            baseline = len(data)
+        print(f"{mode:>8} {ext:>6} {str(level if level is not None else '-'):>5} "
+              f"{t_render * 1e3:>11.1f} {t_encode * 1e3:>11.1f} {len(data):>10} {len(data) / baseline:>9.2f}x")
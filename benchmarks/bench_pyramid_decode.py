@@ -0,0 +1,55 @@
+"""
+고해상도 페이지 스캔 복원 벤치마크: 원본 전체 검출(auto) vs coarse-to-fine(pyramid)
+흰 페이지 임의 위치에 점자 블록 + 잡티를 넣은 합성 스캔 사용
+실행: python -m benchmarks.bench_pyramid_decode [dpi ...]
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+import cv2
+
+from braille.braille_renderer import cell_geometry, render_braille_cells
+from braille.braille_decoder import decode_cells_auto, decode_cells_pyramid
+from braille.braille_translator import unicode_to_cells
+from benchmarks.bench_braille_to_text import make_sample
+
+# A4 (mm)
+PAGE_MM = (297, 210)
+
+def make_page(dpi, ncells, max_cols=20, seed=0):
+    """A4 크기 흰 페이지에 점자 블록을 임의 위치로 배치한 그레이스케일 스캔 -> (이미지, 기대 셀 배열)"""
+    rnd = random.Random(seed)
+    cells = unicode_to_cells(make_sample(ncells, seed))
+    block = cv2.cvtColor(render_braille_cells(cells, cell_geometry(dpi), max_cols), cv2.COLOR_BGR2GRAY)
+    page_h, page_w = (int(mm * dpi / 25.4) for mm in PAGE_MM)
+    page_h = max(page_h, block.shape[0])
+    page_w = max(page_w, block.shape[1])
+    page = np.full((page_h, page_w), 255, dtype=np.uint8)
+    y = rnd.randrange(page_h - block.shape[0] + 1)
+    x = rnd.randrange(page_w - block.shape[1] + 1)
+    page[y:y + block.shape[0], x:x + block.shape[1]] = block
+    for _ in range(50):  # 스캔 잡티
+        cv2.circle(page, (rnd.randrange(page_w), rnd.randrange(page_h)), 1, 0, -1)
+    return page, cells.rstrip(b'\x00')
+
+def bench(fn, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+if __name__ == "__main__":
+    dpis = [int(x) for x in sys.argv[1:]] or [150, 300, 600, 1200]
+    print(f"{'dpi':>6} {'pixels':>10} {'auto(s)':>9} {'pyramid(s)':>11} {'speedup':>8}")
+    for dpi in dpis:
+        page, expected = make_page(dpi, 300)
+        t_auto, out_auto = bench(decode_cells_auto, page)
+        t_pyr, out_pyr = bench(decode_cells_pyramid, page)
+        assert out_pyr == expected, "pyramid 복원 결과 불일치"
+        note = "" if out_auto == expected else " (auto 불일치)"
+        print(f"{dpi:>6} {page.size:>10} {t_auto:>9.3f} {t_pyr:>11.3f} {t_auto / t_pyr:>7.1f}x{note}")
@@ -0,0 +1,277 @@
+"""
+번역기/렌더러/복원기 주요 경로 마이크로 벤치마크 (재현 가능한 합성 말뭉치 + JSON 결과 + 기준선 비교)
+- 말뭉치: 한글/영문(대소문자)/숫자/문장부호 혼합 텍스트, 고정 시드로 UTF-8 기준 지정 크기(1K ~ 100M) 생성
+- 항목: text_to_braille, braille_to_text, make_braille_image, make_braille_image_and_saveinfo, decode_braille_image
+  (이미지 항목은 렌더링 이미지 크기가 셀 수에 비례하므로 --image-max 이하 크기에서만 측정)
+- 측정: 최소 시간(짧은 항목은 0.5초 이상 반복한 중 최솟값), 처리량(MB/s, cell/s), 최대 메모리(tracemalloc 피크, 별도 1회 실행)
+- 결과를 JSON으로 저장하고, 기준선 JSON과 비교해 threshold(--threshold, 기본 20%) 이상 느려진 항목이 있으면 종료 코드 1
+  (단일 CPU 등 잡음이 큰 환경에서는 --rounds로 여러 번 번갈아 측정한 최소 시간으로 비교)
+
+실행:
+  python -m benchmarks.bench_suite -o bench_base.json                  # 기준선 저장
+  python -m benchmarks.bench_suite --baseline bench_base.json --rounds 3   # 비교 (3회 번갈아 측정한 최소 시간)
+  python -m benchmarks.bench_suite --sizes 1K 1M 100M --cases text_to_braille braille_to_text
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from braille.braille_audit import AuditLog
+from braille.braille_translator import text_to_braille, braille_to_text
+
+DEFAULT_SIZES = ["1K", "10K", "100K", "1M", "10M", "100M"]
+_UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+_HANGUL_WORDS = ["안녕하세요", "점자", "닭갈비", "그래서", "그러나", "것이", "했습니다", "읽기", "쉬운", "한글"]
+_ENGLISH_WORDS = ["Braille", "abc", "dots", "Hello", "World", "cell", "Seoul", "KOREA"]
+_DIGIT_WORDS = ["2025", "3.14", "100", "7", "010", "42"]
+_PUNCTUATION = [".", ",", "!", "?", "(", ")", "-", ":"]
+
+def parse_size(text):
+    """"1K", "100M", "4096" -> 바이트 수"""
+    text = text.strip().upper()
+    if text[-1:] in _UNITS:
+        return int(float(text[:-1]) * _UNITS[text[-1]])
+    return int(text)
+
+def make_corpus(nbytes, seed=0):
+    """
+    UTF-8 기준 nbytes 이하(최대한 가깝게)의 혼합 텍스트. 단어 종류 비율: 한글 6, 영문 2, 숫자 1, 문장부호 1.
+    같은 (nbytes, seed)면 항상 같은 텍스트.
+    """
+    rnd = random.Random(seed)
+    pools = [_HANGUL_WORDS] * 6 + [_ENGLISH_WORDS] * 2 + [_DIGIT_WORDS, _PUNCTUATION]
+    vocab = [word for pool in pools for word in pool]
+    weights = [1 / len(pool) for pool in pools for _ in pool]
+    avg = sum(len(w.encode("utf-8")) + 1 for w in vocab) / len(vocab)
+    chunks = []
+    size = 0
+    while size < nbytes:
+        words = rnd.choices(vocab, weights, k=max(int((nbytes - size) / avg) + 1, 16))
+        chunk = " ".join(words) + " "
+        chunks.append(chunk)
+        size += len(chunk.encode("utf-8"))
+    data = "".join(chunks).encode("utf-8")[:nbytes]
+    return data.decode("utf-8", errors="ignore").rstrip()
+
+# ---------------------- 측정 항목 ----------------------
+# 각 항목: setup(텍스트, 작업 폴더, 감사 로그) -> 인자, run(인자) 를 측정 (setup 시간은 제외)
+
+def _setup_text(text, workdir, audit_log):
+    return text
+
+def _setup_braille(text, workdir, audit_log):
+    return text_to_braille(text, use_unicode=True)
+
+def _setup_image_path(text, workdir, audit_log):
+    return text, os.path.join(workdir, "bench.png")
+
+def _setup_saveinfo(text, workdir, audit_log):
+    return text, os.path.join(workdir, "saveinfo"), audit_log
+
+def _setup_png_bytes(text, workdir, audit_log):
+    from braille.braille_converter import encode_braille_image
+    data, _ = encode_braille_image(text)
+    return data
+
+def _run_text_to_braille(text):
+    return text_to_braille(text, use_unicode=True)
+
+def _run_braille_to_text(braille):
+    return braille_to_text(braille)
+
+def _run_make_braille_image(arg):
+    from braille.braille_converter import make_braille_image
+    text, path = arg
+    return make_braille_image(text, save_path=path)
+
+def _run_make_braille_image_and_saveinfo(arg):
+    from braille.braille_image_utils import make_braille_image_and_saveinfo
+    text, save_dir, audit_log = arg
+    return make_braille_image_and_saveinfo(text, save_dir=save_dir, audit_log=audit_log)
+
+def _run_decode_braille_image(data):
+    from braille.braille_converter import decode_braille_image
+    return decode_braille_image(data)
+
+# 이름 -> (setup, run, 이미지 항목 여부)
+CASES = {
+    "text_to_braille": (_setup_text, _run_text_to_braille, False),
+    "braille_to_text": (_setup_braille, _run_braille_to_text, False),
+    "make_braille_image": (_setup_image_path, _run_make_braille_image, True),
+    "make_braille_image_and_saveinfo": (_setup_saveinfo, _run_make_braille_image_and_saveinfo, True),
+    "decode_braille_image": (_setup_png_bytes, _run_decode_braille_image, True),
+}
+
+def time_best(fn, arg, repeat=5, min_time=0.5, max_time=5.0):
+    """
+    최소 repeat회 + 누적 min_time초가 될 때까지 반복 실행한 중 최소 시간 (짧은 항목의 측정 잡음 감소).
+    누적 max_time초를 넘으면 반복 횟수와 관계없이 중단 (대용량 말뭉치는 1회만 실행될 수 있음).
+    """
+    best = float("inf")
+    total = 0.0
+    runs = 0
+    while True:
+        t0 = time.perf_counter()
+        fn(arg)
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+        if (runs >= repeat and total >= min_time) or total >= max_time:
+            return best
+
+def peak_memory(fn, arg):
+    """fn(arg) 1회 실행 중 tracemalloc 피크 (실행 전 할당량 제외, numpy 버퍼 포함)"""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - base, 0)
+
+def run_suite(
+    sizes, cases, repeat=5, image_max=parse_size("2K"), memory=True, seed=0, progress=sys.stderr,
+    rounds=1, min_time=0.5,
+):
+    """
+    말뭉치 크기 x 항목 측정 -> 결과 목록.
+    rounds > 1이면 전체 항목을 rounds번 번갈아 측정해 항목별 최소 시간 사용 (일시적인 시스템 부하로 한 항목만 느려지는 잡음 감소)
+    """
+    corpora = {label: make_corpus(parse_size(label), seed) for label in sizes}
+    best = {}
+    peaks = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        # make_braille_image_and_saveinfo의 감사 로그는 프로세스 공용 로그 대신 임시 폴더의 전용 로그로
+        audit_log = AuditLog(os.path.join(workdir, "audit"))
+        try:
+            for round_no in range(rounds):
+                for label, text in corpora.items():
+                    for name in cases:
+                        setup, run, is_image = CASES[name]
+                        if is_image and parse_size(label) > image_max:
+                            continue
+                        arg = setup(text, workdir, audit_log)
+                        seconds = time_best(run, arg, repeat, min_time)
+                        best[name, label] = min(seconds, best.get((name, label), float("inf")))
+                        if memory and round_no == 0:
+                            peaks[name, label] = peak_memory(run, arg)
+                        if progress:
+                            print(f"[bench] round {round_no + 1}/{rounds} {name} {label}: {seconds:.4f}s", file=progress)
+        finally:
+            # 임시 폴더 삭제 전에 감사 로그 기록 스레드 종료
+            audit_log.close()
+
+    results = []
+    for label, text in corpora.items():
+        nbytes = len(text.encode("utf-8"))
+        ncells = len(text_to_braille(text, use_unicode=True))
+        for name in cases:
+            if (name, label) not in best:
+                continue
+            seconds = best[name, label]
+            results.append({
+                "case": name,
+                "size": label,
+                "bytes": nbytes,
+                "cells": ncells,
+                "seconds": seconds,
+                "mb_per_s": nbytes / seconds / 1e6,
+                "cells_per_s": ncells / seconds,
+                "peak_bytes": peaks.get((name, label)),
+            })
+    return results
+
+def suite_metadata(seed):
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+    }
+
+def compare(results, baseline, threshold=0.20):
+    """
+    기준선 대비 비율 계산 -> (비교 행 목록, 회귀 항목 목록).
+    시간 비율 또는 최대 메모리 비율이 1 + threshold를 넘으면 회귀.
+    """
+    base = {(r["case"], r["size"]): r for r in baseline["results"]}
+    rows = []
+    regressions = []
+    for r in results:
+        b = base.get((r["case"], r["size"]))
+        if b is None:
+            continue
+        time_ratio = r["seconds"] / b["seconds"]
+        mem_ratio = None
+        if r["peak_bytes"] and b.get("peak_bytes"):
+            mem_ratio = r["peak_bytes"] / b["peak_bytes"]
+        regressed = time_ratio > 1 + threshold or (mem_ratio is not None and mem_ratio > 1 + threshold)
+        rows.append((r, time_ratio, mem_ratio, regressed))
+        if regressed:
+            regressions.append(r)
+    return rows, regressions
+
+def print_results(results, out=sys.stdout):
+    print(f"{'case':<32} {'size':>5} {'cells':>11} {'time(s)':>10} {'MB/s':>8} {'Mcell/s':>8} {'peak MB':>8}", file=out)
+    for r in results:
+        peak = f"{r['peak_bytes'] / 1e6:>8.1f}" if r["peak_bytes"] is not None else f"{'-':>8}"
+        print(f"{r['case']:<32} {r['size']:>5} {r['cells']:>11} {r['seconds']:>10.4f} "
+              f"{r['mb_per_s']:>8.2f} {r['cells_per_s'] / 1e6:>8.3f} {peak}", file=out)
+
+def print_comparison(rows, out=sys.stdout):
+    print(f"{'case':<32} {'size':>5} {'time':>8} {'memory':>8}", file=out)
+    for r, time_ratio, mem_ratio, regressed in rows:
+        mem = f"{mem_ratio:>7.2f}x" if mem_ratio is not None else f"{'-':>8}"
+        flag = "  << 회귀" if regressed else ""
+        print(f"{r['case']:<32} {r['size']:>5} {time_ratio:>7.2f}x {mem}{flag}", file=out)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점자 변환/렌더링/복원 마이크로 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="말뭉치 크기 (예: 1K 10M)")
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5, help="항목당 최소 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="항목당 최소 누적 측정 시간(초)")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help="전체 항목을 번갈아 측정할 횟수 (항목별 최소 시간 사용, 회귀 판정용으로는 3 이상 권장)")
+    parser.add_argument("--image-max", default="2K", help="이미지 항목을 측정할 최대 말뭉치 크기")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정 생략 (tracemalloc 실행 1회 절약)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.20, help="회귀 판정 비율 (기본 0.20 = 20%% 느려짐)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        args.sizes, args.cases, args.repeat, parse_size(args.image_max), not args.no_memory, args.seed,
+        rounds=args.rounds, min_time=args.min_time,
+    )
+    print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": suite_metadata(args.seed), "results": results}, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.threshold)
+        print(file=sys.stdout)
+        print_comparison(rows)
+        if regressions:
+            print(f"\n기준선 대비 {args.threshold:.0%} 이상 회귀: {len(regressions)}개 항목", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+번역 전용 경로의 import 시간 예산 확인 (python -X importtime 기반, 새 인터프리터에서 측정)
+- 대상 모듈마다 import 누적 시간(시작 시 site 등 제외)이 예산 이하인지 확인
+- 번역만 쓰는 경로에서 불러오면 안 되는 모듈(cv2, numpy)이 import되면 예산과 관계없이 실패
+- 하나라도 실패하면 종료 코드 1 (CI 등에서 사용)
+
+실행: python -m benchmarks.check_import_time [--budget-ms 150] [--repeat 3] [모듈 ...]
+"""
+
+import argparse
+import subprocess
+import sys
+
+DEFAULT_TARGETS = [
+    "braille.braille_translator",
+    "braille.braille_converter",
+    "braille.text_to_braille_bits",
+]
+FORBIDDEN_MODULES = ("cv2", "numpy")
+
+def measure_import(module, forbidden=FORBIDDEN_MODULES):
+    """
+    새 인터프리터에서 module import -> (누적 시간 ms, 함께 import된 금지 모듈 목록).
+    -X importtime 출력에서 site 이후의 최상위 항목(들여쓰기 없음) 누적 시간을 합산.
+    """
+    code = (
+        f"import sys, {module}; "
+        f"sys.stdout.write(','.join(m for m in {tuple(forbidden)!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    total_us = 0
+    after_site = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            continue  # 다른 모듈 안에서 import된 항목 (상위 항목 누적 시간에 포함)
+        if after_site:
+            total_us += int(cumulative)
+        elif name.strip() == "site":
+            after_site = True
+    loaded = [m for m in proc.stdout.split(",") if m]
+    return total_us / 1e3, loaded
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="번역 전용 경로 import 시간 예산 확인")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="모듈별 import 시간 예산 (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    print(f"{'module':<36} {'import(ms)':>10} {'budget':>8}  result")
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        loaded = sorted({m for _, mods in runs for m in mods})
+        problems = []
+        if best > args.budget_ms:
+            problems.append("예산 초과")
+        if loaded:
+            problems.append(f"금지 모듈 import: {', '.join(loaded)}")
+        failed += bool(problems)
+        print(f"{module:<36} {best:>10.1f} {args.budget_ms:>8.0f}  {'; '.join(problems) or 'ok'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+한글 약자/약어 최장일치 매칭용 트라이(trie)
+- 약자 테이블을 import 시점에 한 번만 컴파일
+- 매칭 비용은 약자 개수와 무관 (입력 위치당 최대 약자 길이만큼만 탐색)
+"""
+
+# 트라이 노드(dict)에서 약자 종료 지점의 점자값을 저장하는 키
+_TERMINAL = None
+
+def build_abbreviation_trie(abbreviations):
+    """{약자 문자열: 점자값} 딕셔너리 -> 중첩 딕셔너리 트라이"""
+    root = {}
+    for word, bits in abbreviations.items():
+        if not word:
+            continue
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_TERMINAL] = bits
+    return root
+
+def match_abbreviation(trie, text, i):
+    """text[i:]로 시작하는 최장 약자를 찾아 (글자 수, 점자값) 반환. 없으면 None."""
+    node = trie.get(text[i])
+    if node is None:
+        return None
+    best = None
+    j = i + 1
+    n = len(text)
+    while True:
+        if _TERMINAL in node:
+            best = (j - i, node[_TERMINAL])
+        if j >= n:
+            break
+        node = node.get(text[j])
+        if node is None:
+            break
+        j += 1
+    return best
@@ -0,0 +1,153 @@
+"""
+변환/복원 기록용 추가 전용(append-only) 감사 로그
+- 요청 처리 스레드는 기록을 메모리 큐에 넣기만 하고(파일 생성/쓰기 없음), 백그라운드 스레드가 모아서 기록
+- 출력: 디렉토리 안의 JSONL 세그먼트 파일 (audit_<시작 시각>_<pid>_<번호>.jsonl), 크기 한도를 넘으면 새 세그먼트
+- 큐가 가득 차면 요청을 막지 않고 기록을 버리고 개수만 셈 (dropped)
+- 기존: 요청/렌더링마다 data/*.json 파일을 하나씩 생성 (같은 초의 요청끼리 덮어쓰고 파일 수가 무한히 증가)
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+
+_STOP = object()
+
+class AuditLog:
+    def __init__(
+        self,
+        directory="data/audit",
+        max_segment_bytes=64 * 1024 * 1024,
+        max_batch=1000,
+        max_pending=100_000,
+    ):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_batch = max_batch
+        self.dropped = 0
+        self.segment_path = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._file = None
+
+    def _start(self):
+        # 첫 기록 때 기록 스레드 시작 (prefork 서버에서 fork 이후 프로세스마다 따로 시작되도록)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="braille-audit", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def record(self, event, **fields):
+        """
+        기록 한 건 추가 (event 종류, 기록 시각 ts 자동 포함). 블로킹/파일 입출력 없음.
+        Returns: 큐에 넣은 기록(dict), 큐가 가득 차 버렸으면 None
+        """
+        if self._thread is None:
+            self._start()
+        entry = {"event": event, "ts": datetime.now().isoformat(), **fields}
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            return None
+        return entry
+
+    def _open_segment(self):
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        seq = 0
+        while True:
+            path = os.path.join(self.directory, f"audit_{stamp}_{os.getpid()}_{seq:04d}.jsonl")
+            try:
+                self._file = open(path, "x", encoding="utf-8")
+                break
+            except FileExistsError:
+                seq += 1
+        self.segment_path = path
+
+    def _write_batch(self, batch):
+        """기록 묶음을 현재 세그먼트에 추가. 직렬화/쓰기에 실패한 기록은 버리고 개수만 셈"""
+        lines = []
+        for entry in batch:
+            try:
+                lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            except (TypeError, ValueError):
+                self.dropped += 1
+        if not lines:
+            return
+        try:
+            # 크기 한도를 넘은 세그먼트는 다음 기록이 생길 때 교체 (빈 세그먼트를 미리 만들지 않음)
+            if self._file is not None and self._file.tell() >= self.max_segment_bytes:
+                self._close_segment()
+            if self._file is None:
+                self._open_segment()
+            self._file.write("".join(lines))
+            self._file.flush()
+        except Exception:
+            # 세그먼트를 열거나 쓰지 못함: 다음 기록 때 새 세그먼트를 다시 열도록 닫아 둠
+            self._close_segment()
+            self.dropped += len(lines)
+
+    def _close_segment(self):
+        file, self._file = self._file, None
+        if file is not None:
+            try:
+                file.close()
+            except Exception:
+                pass
+
+    def _run(self):
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            batch = []
+            # 큐에 쌓인 기록을 최대 max_batch건까지 한 번에 기록
+            while True:
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception:
+                self.dropped += len(batch)
+            finally:
+                # 기록 실패와 관계없이 완료 처리 (flush()가 영원히 기다리지 않도록)
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+        self._close_segment()
+
+    def flush(self):
+        """지금까지 넣은 기록이 모두 파일에 쓰일 때까지 대기"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """남은 기록을 모두 쓰고 기록 스레드 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join()
+
+_default_log = None
+_default_lock = threading.Lock()
+
+def default_audit_log():
+    """프로세스 공용 감사 로그 (디렉토리: BRAILLE_AUDIT_DIR, 기본 data/audit)"""
+    global _default_log
+    with _default_lock:
+        if _default_log is None:
+            _default_log = AuditLog(os.environ.get("BRAILLE_AUDIT_DIR", "data/audit"))
+        return _default_log
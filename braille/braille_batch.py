@@ -0,0 +1,146 @@
+"""
+점자 이미지 일괄 복원 (폴더 / zip / tar 아카이브)
+- 입력 이미지를 프로세스 풀로 분산하되 진행 중 작업 수를 제한(max_inflight)해 메모리 사용을 고정
+- 결과는 입력 순서대로 JSONL 한 줄씩 기록: {"index", "name", "text"} 또는 실패 시 {"index", "name", "error"}
+- 처리 개수/처리량을 주기적으로 stderr에 출력
+
+실행: python -m braille.braille_batch 입력(폴더|.zip|.tar[.gz]) [-o 결과.jsonl] [--workers N] [--method auto]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .braille_translator import braille_to_text
+from .braille_renderer import cell_geometry
+from .braille_decoder import decode_cells, read_gray_image
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp', '.pgm', '.ppm')
+
+def _is_image(name):
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+def iter_batch_inputs(src):
+    """
+    입력 경로 -> (이름, 파일 경로 또는 바이트) 순회.
+    폴더는 하위 폴더 포함 경로 정렬 순, zip은 목록 순, tar는 스트리밍으로 아카이브 저장 순.
+    폴더 항목은 경로만 넘겨 작업 프로세스가 직접 읽고, 아카이브 항목은 바이트로 넘김.
+    """
+    if os.path.isdir(src):
+        paths = []
+        for root, dirs, files in os.walk(src):
+            dirs.sort()
+            paths.extend(os.path.join(root, f) for f in sorted(files) if _is_image(f))
+        for path in paths:
+            yield os.path.relpath(path, src), path
+    elif zipfile.is_zipfile(src):
+        with zipfile.ZipFile(src) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and _is_image(info.filename):
+                    yield info.filename, zf.read(info)
+    elif tarfile.is_tarfile(src):
+        with tarfile.open(src, 'r|*') as tf:
+            for member in tf:
+                if member.isfile() and _is_image(member.name):
+                    yield member.name, tf.extractfile(member).read()
+    else:
+        raise ValueError(f"폴더, zip, tar 아카이브만 지원합니다: {src}")
+
+def count_batch_inputs(src):
+    """진행률 표시용 입력 개수 (tar는 전체를 한 번 더 읽어야 하므로 None)"""
+    if os.path.isdir(src):
+        return sum(1 for _, _, files in os.walk(src) for f in files if _is_image(f))
+    if zipfile.is_zipfile(src):
+        with zipfile.ZipFile(src) as zf:
+            return sum(1 for info in zf.infolist() if not info.is_dir() and _is_image(info.filename))
+    return None
+
+def _decode_item(task):
+    """작업 단위: (이름, 경로 또는 바이트, 셀 규격, max_cols, 복원 방식) -> 결과 dict"""
+    name, source, geometry, max_cols, method = task
+    try:
+        img = read_gray_image(source)
+        cells = decode_cells(img, geometry, max_cols, method=method)
+        return {"name": name, "text": braille_to_text(cells, is_unicode=False)}
+    except Exception as e:
+        return {"name": name, "error": f"{type(e).__name__}: {e}"}
+
+def decode_batch(
+    src,
+    dpi=300,
+    max_cols=20,
+    method="contours",
+    workers=None,
+    max_inflight=None,
+):
+    """
+    폴더/아카이브의 점자 이미지를 프로세스 풀에서 복원해 입력 순서대로 결과 dict를 yield.
+    진행 중(제출했으나 아직 내보내지 않은) 작업은 max_inflight개(기본: 작업자 수 x 4)로 제한.
+    """
+    geometry = cell_geometry(dpi)
+    workers = workers or os.cpu_count() or 1
+    max_inflight = max_inflight or workers * 4
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for name, source in iter_batch_inputs(src):
+            if len(pending) >= max_inflight:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_decode_item, (name, source, geometry, max_cols, method)))
+        while pending:
+            yield pending.popleft().result()
+
+def run_batch(src, out, progress=sys.stderr, interval=1.0, **options):
+    """decode_batch 결과를 out(텍스트 스트림)에 JSONL로 기록하고 진행 상황 출력. (성공, 실패) 개수 반환."""
+    total = count_batch_inputs(src)
+    done = failed = 0
+    start = last = time.perf_counter()
+
+    def report(final=False):
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed if elapsed else 0.0
+        of = f"/{total}" if total is not None else ""
+        end = "\n" if final else "\r"
+        print(f"[batch] {done}{of} 완료, 실패 {failed}, {rate:.1f} img/s, {elapsed:.1f}s", end=end, file=progress)
+
+    for index, result in enumerate(decode_batch(src, **options)):
+        out.write(json.dumps({"index": index, **result}, ensure_ascii=False) + "\n")
+        done += 1
+        failed += "error" in result
+        now = time.perf_counter()
+        if progress and now - last >= interval:
+            report()
+            last = now
+    if progress:
+        report(final=True)
+    return done - failed, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점자 이미지 폴더/아카이브 일괄 복원 (JSONL 출력)")
+    parser.add_argument("src", help="이미지 폴더 또는 zip/tar 아카이브")
+    parser.add_argument("-o", "--output", help="결과 JSONL 경로 (기본: 표준 출력)")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--max-cols", type=int, default=20)
+    parser.add_argument("--method", default="contours", choices=["contours", "grid", "auto", "pyramid"])
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--max-inflight", type=int, default=None, help="동시에 진행 중인 최대 작업 수")
+    args = parser.parse_args(argv)
+
+    options = dict(
+        dpi=args.dpi, max_cols=args.max_cols, method=args.method,
+        workers=args.workers, max_inflight=args.max_inflight,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            ok, failed = run_batch(args.src, out, **options)
+    else:
+        ok, failed = run_batch(args.src, sys.stdout, **options)
+    return 1 if failed and not ok else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+점자 이미지 렌더링 결과 캐시 (content-addressed)
+- 키: (텍스트, dpi, max_cols, 셀 규격, 이미지 포맷/모드/압축, 점자 테이블 버전)의 SHA-256 → HTTP ETag로도 사용
+- 메모리 LRU 계층(총 바이트 기준 축출) + 선택적 디스크 계층
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .braille_translator import table_version
+from .braille_geometry import cell_geometry
+
+def render_cache_key(text, dpi=300, max_cols=20, ext=".png", geometry=None, mode="bgr", compression=None):
+    """렌더링 입력 전체를 해시한 캐시 키(16진 문자열)"""
+    if geometry is None:
+        geometry = cell_geometry(dpi)
+    key = [table_version(), text, dpi, max_cols, list(geometry), ext]
+    if mode != "bgr" or compression is not None:
+        key += [mode, compression]  # 기본 출력의 기존 키는 그대로 유지
+    src = json.dumps(key, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(src.encode('utf-8')).hexdigest()
+
+class RenderCache:
+    """키 -> 인코딩된 이미지 바이트. 메모리 LRU(max_bytes 한도) + disk_dir 지정 시 디스크 계층."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def size(self):
+        """메모리 계층에 보관 중인 총 바이트 수"""
+        return self._size
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key[:2], key)
+
+    def _put_memory(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def get(self, key):
+        """캐시된 바이트 반환. 메모리 → 디스크 순으로 조회, 없으면 None."""
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return data
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = None
+            if data is not None:
+                self._put_memory(key, data)
+                self.hits += 1
+                return data
+        self.misses += 1
+        return None
+
+    def put(self, key, data):
+        """메모리 계층에 저장, 디스크 계층이 있으면 원자적으로(임시 파일 → rename) 기록"""
+        self._put_memory(key, data)
+        if self.disk_dir:
+            path = self._disk_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def get_or_render(self, key, render):
+        """캐시 조회 후 없으면 render()로 바이트를 만들어 저장"""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
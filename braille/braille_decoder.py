@@ -0,0 +1,377 @@
+"""
+점자 이미지 → 셀 배열 복원 공용 단계
+- 점 검출(이진화 + 윤곽선) → 셀 격자의 기대 점 위치 계산 → 점 위치 조회 → 셀 비트마스크
+- 점 위치 조회는 검출된 점 중심을 점유 마스크로 래스터화해 위치당 O(1) 인덱싱
+  (기존: 기대 위치마다 전체 점 목록 선형 탐색, 페이지 크기에 대해 제곱 비용)
+- 규격을 아는 이미지는 점 검출 없이 적분 영상 샘플링으로 복원 가능 (sample_grid_cells)
+- 규격/여백을 모르는 이미지는 점 중심 투영으로 점 간격, 셀 간격, 격자 원점을 추정 (estimate_grid_layout)
+- 고해상도 스캔은 축소본에서 점자 영역/점 크기를 찾아 해당 영역만 적정 배율로 검출 (decode_cells_pyramid)
+- 단계별 소요 시간 계측: detect(점 검출) / grid-fit(격자 위치 계산·추정) / decode(점 위치 조회) (braille_metrics)
+- 입력은 파일 경로뿐 아니라 인코딩된 이미지 바이트/버퍼, 디코딩된 배열도 가능 (read_gray_image)
+"""
+
+import os
+from typing import NamedTuple
+
+import numpy as np
+import cv2
+
+from .braille_geometry import DOT_COORDS, cell_origin
+from .braille_metrics import observe, span
+
+# 비트 번호별 점 오프셋 (열, 행)
+_DOT_DX = np.array([dx for dx, _ in DOT_COORDS])
+_DOT_DY = np.array([dy for _, dy in DOT_COORDS])
+_DOT_BITS = np.array([1 << idx for idx in range(len(DOT_COORDS))], dtype=np.uint8)
+
+# 격자 추정에서 셀 간격을 구할 수 없을 때 쓰는 표준 규격 비율 (cell_geometry 기본값, mm)
+_STD_DOT_DIAMETER = 1.5
+_STD_DOT_GAP = 2.5
+_STD_CELL_W = 6.0
+_STD_CELL_H = 10.0
+
+def read_gray_image(source):
+    """
+    이미지 입력 -> 그레이스케일 uint8 배열.
+    - 파일 경로(str/PathLike): cv2.imread
+    - 인코딩된 이미지 바이트(bytes/bytearray/memoryview) 또는 1차원 uint8 배열: 디스크 없이 cv2.imdecode
+    - 디코딩된 2차원(그레이) / 3차원(BGR, BGRA) 배열: 그대로 또는 그레이 변환
+    """
+    if isinstance(source, (str, os.PathLike)):
+        img = cv2.imread(os.fspath(source), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise FileNotFoundError(f"이미지 파일을 읽을 수 없습니다: {source}")
+        return img
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = np.frombuffer(source, dtype=np.uint8)
+    if not isinstance(source, np.ndarray):
+        raise TypeError(f"지원하지 않는 이미지 입력: {type(source).__name__}")
+    if source.ndim == 1:
+        img = cv2.imdecode(source, cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            raise ValueError("이미지 데이터를 디코딩할 수 없습니다")
+        return img
+    if source.ndim == 3:
+        code = cv2.COLOR_BGRA2GRAY if source.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        return cv2.cvtColor(source, code)
+    return source
+
+def binarize(gray, blur=True):
+    """그레이스케일 -> 이진 이미지 (점=255, 배경=0, Otsu 임계값)"""
+    if blur:
+        gray = cv2.GaussianBlur(gray, (5,5), 0)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    return binary
+
+@span("detect")
+def detect_dots(gray):
+    """그레이스케일 이미지 -> (점 중심 좌표 (N, 2) int 배열, 외접원 반지름 (N,) float 배열), 크기 필터링 없음"""
+    binary = binarize(gray)
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    centers = np.empty((len(contours), 2), dtype=np.int64)
+    radii = np.empty(len(contours), dtype=np.float64)
+    for i, cnt in enumerate(contours):
+        (x, y), r = cv2.minEnclosingCircle(cnt)
+        centers[i] = int(round(x)), int(round(y))
+        radii[i] = r
+    observe("dots", len(contours))
+    return centers, radii
+
+def detect_dot_centers(gray, dot_r):
+    """그레이스케일 이미지 -> 점 중심 좌표 (N, 2) int 배열 [(x, y), ...]"""
+    centers, radii = detect_dots(gray)
+    return centers[radii >= dot_r * 0.7]  # 점 크기 필터링
+
+def expected_dot_positions(nrow, ncol, geometry):
+    """셀 격자(nrow x ncol)의 기대 점 중심 좌표 -> (cx, cy), 각각 (nrow * ncol, 6) int 배열"""
+    x0, y0 = cell_origin(geometry)
+    rows, cols = np.divmod(np.arange(nrow * ncol), ncol)
+    cx = (cols * geometry.cell_w + x0)[:, None] + _DOT_DX * geometry.xgap
+    cy = (rows * geometry.cell_h + y0)[:, None] + _DOT_DY * geometry.ygap
+    return cx, cy
+
+class GridLayout(NamedTuple):
+    """이미지 위 셀 격자 배치 (픽셀 단위, 간격은 실수 허용)"""
+    origin_x: float      # 셀 (0, 0)의 점1 중심
+    origin_y: float
+    dot_pitch_x: float   # 셀 내부 점 간격
+    dot_pitch_y: float
+    cell_pitch_x: float  # 셀 간격
+    cell_pitch_y: float
+    ncol: int
+    nrow: int
+    dot_r: int
+
+def grid_layout(geometry, nrow, ncol):
+    """규격을 아는 이미지(격자 원점 (0, 0))의 GridLayout"""
+    x0, y0 = cell_origin(geometry)
+    return GridLayout(
+        x0, y0, geometry.xgap, geometry.ygap, geometry.cell_w, geometry.cell_h,
+        ncol, nrow, geometry.point_r
+    )
+
+def layout_dot_positions(layout):
+    """GridLayout의 기대 점 중심 좌표 -> (cx, cy), 각각 (nrow * ncol, 6) int 배열"""
+    rows, cols = np.divmod(np.arange(layout.nrow * layout.ncol), layout.ncol)
+    cx = (cols * layout.cell_pitch_x + layout.origin_x)[:, None] + _DOT_DX * layout.dot_pitch_x
+    cy = (rows * layout.cell_pitch_y + layout.origin_y)[:, None] + _DOT_DY * layout.dot_pitch_y
+    return np.rint(cx).astype(np.int64), np.rint(cy).astype(np.int64)
+
+def _cluster_positions(values, tol):
+    """1차원 좌표 투영을 tol 이내 간격끼리 묶어 클러스터 중심(오름차순) 반환"""
+    v = np.sort(values).astype(np.float64)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(v) > tol) + 1))
+    counts = np.diff(np.append(starts, len(v)))
+    return np.add.reduceat(v, starts) / counts
+
+def _dot_pitch(lines, min_gap):
+    """클러스터 간격 중 최소 간격 부근(셀 내부 점 간격)의 평균, 없으면 None"""
+    gaps = np.diff(lines)
+    gaps = gaps[gaps >= min_gap]
+    if not len(gaps):
+        return None
+    return gaps[gaps <= gaps.min() * 1.2].mean()
+
+def _has_line(lines, pos, tol):
+    """pos 각각에 대해 tol 이내에 클러스터가 있는지 (lines는 오름차순)"""
+    idx = np.searchsorted(lines, pos)
+    lo = lines[np.clip(idx - 1, 0, len(lines) - 1)]
+    hi = lines[np.clip(idx, 0, len(lines) - 1)]
+    return np.minimum(np.abs(lo - pos), np.abs(hi - pos)) <= tol
+
+def _fit_cell_grid(starts, dot_pitch, fallback):
+    """
+    셀 시작 좌표(오름차순)들 -> (셀 간격, 원점).
+    가장 가까운 시작 간격을 표준 비율에 가까운 약수로 맞춘 초기값으로 이웃 간격마다 셀 번호 차를 매기고
+    (빈 셀이 끼어도 오차가 누적되지 않음) 최소제곱 직선으로 보정.
+    """
+    gaps = np.diff(starts)
+    gaps = gaps[gaps > dot_pitch * 1.5]
+    pitch = fallback
+    if len(gaps):
+        base = gaps[gaps <= gaps.min() * 1.2].mean()
+        pitch = base / max(np.rint(base / fallback), 1)
+    index = np.concatenate(([0], np.cumsum(np.rint(np.diff(starts) / pitch))))
+    if index[-1] > 0:
+        pitch = np.polyfit(index, starts, 1)[0]
+    return pitch, np.mean(starts - index * pitch)
+
+def _grid_extent(lines, start, cell_pitch, tol):
+    """점 열/행 좌표를 모두 덮도록 격자 원점을 앞으로 당기고 셀 개수 계산"""
+    if lines[0] < start - tol:
+        start -= np.ceil((start - lines[0] - tol) / cell_pitch) * cell_pitch
+    count = int((lines[-1] - start + tol) // cell_pitch) + 1
+    return start, count
+
+@span("grid-fit")
+def estimate_grid_layout(centers, radii):
+    """
+    검출된 점 중심만으로 격자 배치(점 간격, 셀 간격, 원점, 셀 개수) 추정. 점이 없으면 None.
+    - x/y 투영 클러스터의 최소 간격 → 점 간격
+    - 점 간격만큼 떨어진 짝이 있는 x 클러스터 → 셀 왼쪽 열,
+      점 간격 1배/2배 위치가 모두 있는 y 클러스터 → 셀 윗 행 → 최소제곱으로 셀 간격과 원점
+    - 한 줄/한 칸뿐이라 셀 간격을 구할 수 없으면 표준 규격 비율 사용
+    """
+    if not len(centers):
+        return None
+    big = radii[radii >= 1.5]
+    dot_r = np.median(big) if len(big) else np.median(radii)
+    centers = centers[radii >= dot_r * 0.7]
+    dot_r = max(int(round(dot_r)), 1)
+    tol = float(dot_r)
+    xs = _cluster_positions(centers[:, 0], tol)
+    ys = _cluster_positions(centers[:, 1], tol)
+
+    pitch_x = _dot_pitch(xs, 1.5 * dot_r)
+    pitch_y = _dot_pitch(ys, 1.5 * dot_r)
+    if pitch_x is None and pitch_y is None:
+        pitch_x = pitch_y = dot_r * 2 * _STD_DOT_GAP / _STD_DOT_DIAMETER
+    pitch_x = pitch_x if pitch_x is not None else pitch_y
+    pitch_y = pitch_y if pitch_y is not None else pitch_x
+    # 셀 시작 열: 오른쪽 짝이 있는 열, 또는 왼쪽 짝이 있는 열 - 점 간격
+    has_x = lambda pos: _has_line(xs, pos, pitch_x * 0.2)
+    left = np.concatenate((xs[has_x(xs + pitch_x)], xs[has_x(xs - pitch_x)] - pitch_x))
+    # 셀 윗 행: 점 간격 1배/2배 아래가 모두 있는 행, 또는 1배/2배 위가 모두 있는 행 - 2 * 점 간격
+    has_y = lambda pos: _has_line(ys, pos, pitch_y * 0.2)
+    top = np.concatenate((
+        ys[has_y(ys + pitch_y) & has_y(ys + 2 * pitch_y)],
+        ys[has_y(ys - pitch_y) & has_y(ys - 2 * pitch_y)] - 2 * pitch_y,
+    ))
+    left = _cluster_positions(left, tol) if len(left) else xs[:1]
+    top = _cluster_positions(top, tol) if len(top) else ys[:1]
+
+    cell_x, origin_x = _fit_cell_grid(left, pitch_x, pitch_x * _STD_CELL_W / _STD_DOT_GAP)
+    cell_y, origin_y = _fit_cell_grid(top, pitch_y, pitch_y * _STD_CELL_H / _STD_DOT_GAP)
+    origin_x, ncol = _grid_extent(xs, origin_x, cell_x, tol)
+    origin_y, nrow = _grid_extent(ys, origin_y, cell_y, tol)
+    return GridLayout(
+        float(origin_x), float(origin_y), float(pitch_x), float(pitch_y),
+        float(cell_x), float(cell_y), ncol, nrow, dot_r
+    )
+
+def dot_occupancy_mask(centers, shape, dot_r):
+    """
+    점 중심을 (2*dot_r+1) 정사각 영역으로 팽창한 점유 마스크.
+    mask[y + dot_r, x + dot_r] != 0 이면 |x - cx| <= dot_r, |y - cy| <= dot_r 인 점 중심이 존재.
+    """
+    h, w = shape
+    mask = np.zeros((h + 2 * dot_r, w + 2 * dot_r), dtype=np.uint8)
+    if len(centers):
+        mask[centers[:, 1] + dot_r, centers[:, 0] + dot_r] = 1
+        kernel = np.ones((2 * dot_r + 1, 2 * dot_r + 1), dtype=np.uint8)
+        mask = cv2.dilate(mask, kernel)
+    return mask
+
+def lookup_dots(mask, cx, cy, dot_r):
+    """점유 마스크에서 기대 위치별 점 존재 여부 조회 (범위 밖은 없음)"""
+    px = cx + dot_r
+    py = cy + dot_r
+    inside = (px >= 0) & (py >= 0) & (px < mask.shape[1]) & (py < mask.shape[0])
+    hits = np.zeros(px.shape, dtype=bool)
+    hits[inside] = mask[py[inside], px[inside]] != 0
+    return hits
+
+def hits_to_cells(hits):
+    """(셀 수, 6) bool 배열 -> 셀 배열(bytes), 끝의 빈 셀 제거"""
+    masks = (hits * _DOT_BITS).sum(axis=1, dtype=np.uint8)
+    return masks.tobytes().rstrip(b'\x00')
+
+@span("decode")
+def decode_dot_cells(centers, shape, cx, cy, dot_r):
+    """검출된 점 중심 + 기대 점 위치 -> 셀 배열 (점유 마스크 조회)"""
+    mask = dot_occupancy_mask(centers, shape, dot_r)
+    return hits_to_cells(lookup_dots(mask, cx, cy, dot_r))
+
+@span("decode")
+def sample_grid_cells(gray, geometry, max_cols=20, window=None, fill_ratio=0.5):
+    """
+    규격을 아는(렌더러가 만든) 이미지용 고속 복원: 점 검출 없이 기대 점 위치를 직접 샘플링.
+    이진 이미지의 적분 영상(cv2.integral)으로 위치별 (2*window+1)^2 이웃 평균을 한 번에 계산해
+    fill_ratio 이상 채워져 있으면 점으로 판정.
+    """
+    img_h, img_w = gray.shape
+    ncol = min(max_cols, img_w // geometry.cell_w)
+    nrow = img_h // geometry.cell_h
+    if window is None:
+        window = max(geometry.point_r // 2, 1)
+    binary = binarize(gray, blur=False)
+    integral = cv2.integral(binary // 255, sdepth=cv2.CV_32S)
+    cx, cy = expected_dot_positions(nrow, ncol, geometry)
+    x1 = np.clip(cx - window, 0, img_w)
+    x2 = np.clip(cx + window + 1, 0, img_w)
+    y1 = np.clip(cy - window, 0, img_h)
+    y2 = np.clip(cy + window + 1, 0, img_h)
+    filled = integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]
+    area = (x2 - x1) * (y2 - y1)
+    hits = (area > 0) & (filled >= fill_ratio * area)
+    return hits_to_cells(hits)
+
+def decode_cells(gray, geometry, max_cols=20, verbose=False, method="contours"):
+    """
+    그레이스케일 점자 이미지 -> 셀 배열 (격자는 좌상단 (0, 0) 기준)
+    - method="contours": 점 검출 후 격자 위치 조회 (일반 이미지)
+    - method="grid": 기대 점 위치 직접 샘플링 (렌더러 출력 등 규격을 아는 이미지, 고속)
+    - method="auto": 검출된 점으로 격자 배치를 추정 (geometry, max_cols 무시)
+    - method="pyramid": auto + 축소본으로 점자 영역만 잘라 적정 배율에서 검출 (고해상도 스캔)
+    """
+    if method == "grid":
+        return sample_grid_cells(gray, geometry, max_cols)
+    if method == "auto":
+        return decode_cells_auto(gray, verbose)
+    if method == "pyramid":
+        return decode_cells_pyramid(gray, verbose)
+    if method != "contours":
+        raise ValueError(f"지원하지 않는 복원 방식: {method}")
+    centers = detect_dot_centers(gray, geometry.point_r)
+    if verbose:
+        print(f"[DEBUG] 검출된 점 개수: {len(centers)}")
+    img_h, img_w = gray.shape
+    ncol = min(max_cols, img_w // geometry.cell_w)
+    nrow = img_h // geometry.cell_h
+    with span("grid-fit"):
+        cx, cy = expected_dot_positions(nrow, ncol, geometry)
+    return decode_dot_cells(centers, gray.shape, cx, cy, geometry.point_r)
+
+def _coarse_scale(shape, max_side):
+    """긴 변이 max_side 이하가 되는 정수 축소 배율"""
+    return max(int(np.ceil(max(shape) / max_side)), 1)
+
+@span("detect")
+def locate_braille_region(gray, max_side=1024):
+    """
+    축소본에서 점자 영역과 점 크기 추정 -> ((x0, y0, x1, y1) 원본 좌표 ROI, 원본 기준 점 반지름), 점이 없으면 None.
+    축소본의 연결 요소 중 면적이 중앙값 부근인 것(점 또는 붙어버린 점 묶음)만 남겨 잡티/테두리를 배제.
+    """
+    h, w = gray.shape
+    scale = _coarse_scale(gray.shape, max_side)
+    # 면적 평균 축소: 간격 추출은 간격이 점 지름보다 크면 점을 건너뛰어 영역이 잘림
+    small = gray
+    if scale > 1:
+        small = cv2.resize(gray, (max(w // scale, 1), max(h // scale, 1)), interpolation=cv2.INTER_AREA)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binarize(small, blur=False))
+    stats = stats[1:]  # 배경 제외
+    if not len(stats):
+        return None
+    area = stats[:, cv2.CC_STAT_AREA]
+    median = np.median(area)
+    stats = stats[(area >= median / 4) & (area <= median * 4)]
+    x0 = stats[:, cv2.CC_STAT_LEFT].min()
+    y0 = stats[:, cv2.CC_STAT_TOP].min()
+    x1 = (stats[:, cv2.CC_STAT_LEFT] + stats[:, cv2.CC_STAT_WIDTH]).max()
+    y1 = (stats[:, cv2.CC_STAT_TOP] + stats[:, cv2.CC_STAT_HEIGHT]).max()
+    dot_r = np.sqrt(median / np.pi) * scale
+    pad = int(np.ceil(scale + dot_r))
+    roi = (
+        max(int(x0 * scale) - pad, 0), max(int(y0 * scale) - pad, 0),
+        min(int(np.ceil(x1 * scale)) + pad, w), min(int(np.ceil(y1 * scale)) + pad, h),
+    )
+    return roi, dot_r
+
+def decode_cells_pyramid(gray, verbose=False, target_r=5, max_side=1024):
+    """
+    고해상도 스캔용 coarse-to-fine 복원: 축소본에서 점자 영역/점 크기를 찾고,
+    원본에서 그 영역만 잘라 점 반지름이 target_r 픽셀 정도가 되는 가장 작은 배율로 줄여 decode_cells_auto.
+    축소 배율에서 점이 붙어 검출되면(반지름이 기대보다 큼) 배율을 절반씩 올려 재시도.
+    점이 축소본 해상도보다 작으면(긴 한 줄 페이지 등) 원본 전체에 decode_cells_auto.
+    """
+    found = locate_braille_region(gray, max_side)
+    if found is None:
+        return b''
+    (x0, y0, x1, y1), dot_r = found
+    scale = _coarse_scale(gray.shape, max_side)
+    if dot_r < scale * 2:
+        # 축소본에서 점 반지름이 2픽셀 미만: 점이 뭉개지거나 여러 점이 한 덩어리가 되어
+        # 영역/점 크기 추정을 믿을 수 없음 → 원본 전체 검출
+        if verbose:
+            print(f"[DEBUG] 축소본 점 반지름 {dot_r / scale:.1f}px (배율 {scale}), 원본 전체 검출로 전환")
+        return decode_cells_auto(gray, verbose)
+    roi = gray[y0:y1, x0:x1]
+    factor = max(dot_r / target_r, 1.0)
+    while True:
+        if factor > 1:
+            size = (max(int(roi.shape[1] / factor), 1), max(int(roi.shape[0] / factor), 1))
+            work = cv2.resize(roi, size, interpolation=cv2.INTER_AREA)
+        else:
+            work = roi
+        centers, radii = detect_dots(work)
+        layout = estimate_grid_layout(centers, radii)
+        if factor == 1 or layout is None or layout.dot_r <= target_r * 1.5:
+            break
+        factor = max(factor / 2, 1.0)
+    if verbose:
+        print(f"[DEBUG] 점자 영역: {(x0, y0, x1, y1)}, 축소 배율: {factor:.2f}, 추정 격자: {layout}")
+    if layout is None:
+        return b''
+    cx, cy = layout_dot_positions(layout)
+    return decode_dot_cells(centers[radii >= layout.dot_r * 0.7], work.shape, cx, cy, layout.dot_r)
+
+def decode_cells_auto(gray, verbose=False):
+    """dpi/셀 규격/여백을 모르는 이미지 복원: 점 검출 → 격자 배치 추정 → 점유 마스크 조회"""
+    centers, radii = detect_dots(gray)
+    layout = estimate_grid_layout(centers, radii)
+    if layout is None:
+        return b''
+    if verbose:
+        print(f"[DEBUG] 검출된 점 개수: {len(centers)}, 추정 격자: {layout}")
+    cx, cy = layout_dot_positions(layout)
+    return decode_dot_cells(centers[radii >= layout.dot_r * 0.7], gray.shape, cx, cy, layout.dot_r)
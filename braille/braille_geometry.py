@@ -0,0 +1,38 @@
+"""
+점자 셀 규격(mm → 픽셀)과 점 배치 (numpy/cv2 없이 사용 가능한 순수 계산)
+- 렌더러/복원기/SVG/캐시 키가 공유, braille_renderer에서도 그대로 re-export
+"""
+
+from typing import NamedTuple
+
+# 6점좌표 (col, row) 기준, 인덱스 = 비트 번호
+DOT_COORDS = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+
+class CellGeometry(NamedTuple):
+    """픽셀 단위 셀 규격 (아틀라스 캐시 키)"""
+    point_r: int
+    xgap: int
+    ygap: int
+    cell_w: int
+    cell_h: int
+
+def cell_geometry(
+    dpi=300,
+    dot_diameter_mm=1.5,
+    dot_gap_mm=2.5,
+    cell_width_mm=6.0,
+    cell_height_mm=10.0
+):
+    """mm 단위 점자 규격 -> 픽셀 단위 CellGeometry"""
+    mm2px = lambda mm: int(round(mm * dpi / 25.4))
+    return CellGeometry(
+        point_r=max(mm2px(dot_diameter_mm) // 2, 2),
+        xgap=mm2px(dot_gap_mm),
+        ygap=mm2px(dot_gap_mm),
+        cell_w=mm2px(cell_width_mm),
+        cell_h=mm2px(cell_height_mm),
+    )
+
+def cell_origin(geometry):
+    """셀 좌상단 기준 점1 중심 좌표 (x0, y0)"""
+    return geometry.cell_w // 2 - geometry.xgap // 2, geometry.cell_h // 2 - geometry.ygap
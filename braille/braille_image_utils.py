@@ -1,12 +1,12 @@
-import json
 import numpy as np
 import cv2
-from concurrent.futures import ThreadPoolExecutor
-from braille.braille_translator import parse_to_braille_cells  # 반드시 풀스펙 매핑 테이블에 의존하는 braille_translator 사용!
+from braille.braille_renderer import cell_geometry, render_braille_cells
+from braille.braille_audit import default_audit_log
+from braille.braille_translator import parse_to_braille_cells, cells_to_unicode  # 반드시 풀스펙 매핑 테이블에 의존하는 braille_translator 사용!
 from datetime import datetime
 import os
 import re
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
 
 def sanitize_filename(text: str, prefix: str = "braille") -> str:
     """
@@ -18,84 +18,39 @@ def sanitize_filename(text: str, prefix: str = "braille") -> str:
     dt = datetime.now().strftime('%Y%m%d_%H%M%S')
     return f"{prefix}_{dt}_{safe_text}_dot.png"
 
-def draw_braille_cell(
-    img: np.ndarray,
-    x0: int,
-    y0: int,
-    pattern: list,
-    point_r: int,
-    xgap: int,
-    ygap: int,
-    dot_color: Tuple[int, int, int] = (0,0,0)
-) -> None:
-    """
-    6점 점자 셀을 이미지에 그림
-    """
-    coords = [
-        (0, 0), (0, 1), (0, 2),
-        (1, 0), (1, 1), (1, 2)
-    ]
-    for idx, dot in enumerate(pattern):
-        if dot:
-            dx, dy = coords[idx]
-            cx = int(round(x0 + dx * xgap))
-            cy = int(round(y0 + dy * ygap))
-            cv2.circle(img, (cx, cy), point_r, dot_color, -1, lineType=cv2.LINE_AA)
-
 def make_braille_image_and_saveinfo(
     text: str,
     dpi: int = 300,
     max_cols: int = 20,
     save_dir: str = "data",
-    n_workers: int = 4
-) -> Tuple[str, np.ndarray, str, Any]:
+    n_workers: int = 4,
+    audit_log=None,
+) -> Tuple[str, np.ndarray, Optional[dict], Any]:
     """
-    텍스트 → 점자 셀 → 이미지, 변환 정보(json) 저장
-    Returns: (img_path, numpy_image, info_path, info_dict)
+    텍스트 → 점자 셀 → 이미지 저장, 변환 정보는 감사 로그에 기록
+    save_dir: 이미지 저장 폴더 (변환 정보는 save_dir가 아닌 감사 로그 폴더에 기록: audit_log 폴더, 기본 BRAILLE_AUDIT_DIR 또는 data/audit)
+    n_workers: 하위 호환용 (아틀라스 렌더링은 셀 단위 병렬화가 필요 없음)
+    audit_log: 기록할 AuditLog (기본: 프로세스 공용 default_audit_log())
+    Returns: (img_path, numpy_image, audit_record, info_dict)
+      audit_record: 감사 로그 큐에 넣은 기록(dict, event/ts + info_dict 항목), 큐가 가득 차 버려졌으면 None
     """
-    mm2px = lambda mm: int(round(mm * dpi / 25.4))
-    point_d_mm = 1.5
-    point_r_px = max(mm2px(point_d_mm) // 2, 2)
-    xgap_px   = mm2px(2.5)
-    ygap_px   = mm2px(2.5)
-    cell_x_px = mm2px(6.0)
-    cell_y_px = mm2px(10.0)
-
     braille_cells = parse_to_braille_cells(text)
-    ncell = len(braille_cells)
-    nrow = (ncell + max_cols - 1) // max_cols
-    ncol = min(ncell, max_cols)
-
-    img_w = cell_x_px * ncol
-    img_h = cell_y_px * nrow
-    img = np.ones((img_h, img_w, 3), dtype=np.uint8) * 255
-
-    def draw_cell_worker(args):
-        k, pattern = args
-        row = k // max_cols
-        col = k % max_cols
-        x0 = cell_x_px * col + cell_x_px // 2 - xgap_px // 2
-        y0 = cell_y_px * row + cell_y_px // 2 - ygap_px
-        draw_braille_cell(img, x0, y0, pattern, point_r_px, xgap_px, ygap_px, dot_color=(0,0,0))
-
-    with ThreadPoolExecutor(max_workers=n_workers) as executor:
-        list(executor.map(draw_cell_worker, enumerate(braille_cells)))
+    img = render_braille_cells(braille_cells, cell_geometry(dpi), max_cols)
 
     os.makedirs(save_dir, exist_ok=True)
     img_filename = sanitize_filename(text)
     img_path = os.path.join(save_dir, img_filename)
     cv2.imwrite(img_path, img)
 
-    # 변환 정보 json 저장
+    # 변환 정보는 감사 로그(JSONL 세그먼트)에 백그라운드 기록
     info = {
         "text": text,
-        "braille_cells": braille_cells,
+        "braille_cells": list(braille_cells),
+        "braille_unicode": cells_to_unicode(braille_cells),
         "image_path": img_filename,
         "created_at": datetime.now().isoformat()
     }
-    info_filename = img_filename.replace('_dot.png', '.json')
-    info_path = os.path.join(save_dir, info_filename)
-    with open(info_path, "w", encoding="utf-8") as f:
-        json.dump(info, f, ensure_ascii=False, indent=2)
+    # 세그먼트 파일은 백그라운드 기록 시점에 정해지므로(교체 가능) 경로 대신 기록 자체를 반환
+    record = (audit_log or default_audit_log()).record("render", **info)
 
-    return img_path, img, info_path, info
\ No newline at end of file
+    return img_path, img, record, info
\ No newline at end of file
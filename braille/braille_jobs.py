@@ -0,0 +1,128 @@
+"""
+웹 서버용 CPU 작업 풀 (렌더링/복원을 요청 스레드 밖 프로세스 풀에서 실행)
+- 동시에 받아들이는 작업 수 = 작업자 수 + 대기열 한도. 넘치면 기다리지 않고 JobQueueFull → 503 응답용
+- 작업자마다 프로세스 1개짜리 실행기를 따로 두고, 작업은 빈 작업자 하나를 독점해서 실행
+- 작업마다 제한 시간(대기 시간 포함). 초과하면 JobTimeout을 내고 그 작업자 프로세스만 종료 후 교체
+  (병적인 입력 하나가 작업자를 계속 점유하지 못하게, 다른 작업자에서 실행 중인 작업은 영향 없음)
+- 작업자 수 0: 프로세스 풀 없이 요청 스레드에서 바로 실행 (개발/디버깅용, 대기열 한도만 적용 — 제한 시간 미적용)
+"""
+
+import os
+import queue
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+class JobQueueFull(RuntimeError):
+    """작업자와 대기열이 모두 찬 상태"""
+
+class JobTimeout(RuntimeError):
+    """작업이 제한 시간 안에 끝나지 않음"""
+
+class _Worker:
+    """작업자 1개: 프로세스 1개짜리 실행기와 그 프로세스 pid (시간 초과 시 이 pid만 종료)"""
+    __slots__ = ("executor", "pid")
+
+    def __init__(self):
+        self.executor = ProcessPoolExecutor(max_workers=1)
+        # 첫 작업으로 프로세스를 띄우고 pid를 받아 둠 (실행기 내부 속성에 의존하지 않도록)
+        self.pid = self.executor.submit(os.getpid).result()
+
+    def terminate(self):
+        # 실행기가 프로세스를 회수(join)하기 전에 종료 신호 (회수 후에는 pid가 재사용될 수 있음)
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # 이미 종료됨
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class JobPool:
+    def __init__(self, workers=None, max_queue=None, timeout=30.0):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_queue = self.workers * 4 if max_queue is None else max_queue
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(self.workers, 1) + self.max_queue)
+        self._lock = threading.Lock()
+        # 작업자 번호 -> _Worker (첫 작업 때 생성), 비어 있는 작업자 번호 대기열
+        self._workers = [None] * self.workers
+        self._idle = queue.Queue()
+        for index in range(self.workers):
+            self._idle.put(index)
+
+    def _get_worker(self, index):
+        # 첫 작업 때 생성 (gunicorn 등 prefork 서버에서는 fork 이후에 만들어지도록).
+        # 작업자 번호는 그 번호를 꺼낸 요청 스레드만 쓰므로 생성은 잠금 밖에서
+        with self._lock:
+            worker = self._workers[index]
+        if worker is None:
+            worker = _Worker()
+            with self._lock:
+                self._workers[index] = worker
+        return worker
+
+    def _recycle(self, index, worker):
+        """제한 시간을 넘긴 작업이 실행 중인 작업자만 교체하고 프로세스 종료"""
+        with self._lock:
+            if self._workers[index] is worker:
+                self._workers[index] = None
+        worker.terminate()
+
+    def _submit(self, index, fn, args, kwargs):
+        """작업자에 작업 제출 -> (작업자, future). 제출 직전에 restart()로 실행기가 닫혔으면 새 작업자로 한 번 재시도"""
+        for attempt in range(2):
+            worker = None
+            try:
+                worker = self._get_worker(index)
+                return worker, worker.executor.submit(fn, *args, **kwargs)
+            except (RuntimeError, BrokenProcessPool):
+                if worker is not None:
+                    self._recycle(index, worker)
+                if attempt:
+                    raise JobQueueFull("작업자가 재시작되었습니다") from None
+
+    def run(self, fn, *args, **kwargs):
+        """
+        fn(*args, **kwargs)를 작업 풀에서 실행하고 결과 반환 (fn, 인자, 결과는 pickle 가능해야 함).
+        빈 자리가 없으면 즉시 JobQueueFull, 빈 작업자를 기다린 시간 포함 self.timeout초 초과 시 JobTimeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise JobQueueFull("작업 대기열이 가득 찼습니다")
+        try:
+            if self.workers == 0:
+                return fn(*args, **kwargs)
+            deadline = time.monotonic() + self.timeout
+            try:
+                index = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise JobTimeout("작업 제한 시간 초과") from None
+            try:
+                worker, future = self._submit(index, fn, args, kwargs)
+                try:
+                    return future.result(max(deadline - time.monotonic(), 0))
+                except FutureTimeout:
+                    self._recycle(index, worker)
+                    raise JobTimeout("작업 제한 시간 초과") from None
+                except BrokenProcessPool:
+                    # 작업자 프로세스가 비정상 종료 (메모리 부족 등)
+                    self._recycle(index, worker)
+                    raise JobQueueFull("작업자가 재시작되었습니다") from None
+            finally:
+                self._idle.put(index)
+        finally:
+            self._slots.release()
+
+    def _replace_all(self):
+        with self._lock:
+            workers, self._workers = self._workers, [None] * self.workers
+        return [worker for worker in workers if worker is not None]
+
+    def restart(self):
+        """이후 작업부터 새 작업자 프로세스 사용 (점자 테이블 교체 등). 진행 중인 작업은 이전 작업자에서 마저 실행"""
+        for worker in self._replace_all():
+            worker.executor.shutdown(wait=False)
+
+    def shutdown(self):
+        for worker in self._replace_all():
+            worker.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,184 @@
+"""
+단계별 처리 시간/규모 계측 (표준 라이브러리만 사용, 변환 경로에 의존성 추가 없음)
+- span("translate" | "layout" | "rasterize" | "encode" | "detect" | "grid-fit" | "decode"): 단계 소요 시간
+- observe("cells" | "dots", n): 요청당 셀 수 / 검출된 점 수
+- 기록 중(recording)이면 기록 목록에 모으고, 아니면 프로세스 공용 레지스트리(REGISTRY)에 바로 누적
+  → 작업 풀 프로세스에서는 call_recorded로 모은 기록을 결과와 함께 돌려받아 요청 프로세스에서 replay
+- REGISTRY.render(): Prometheus 텍스트 형식 (히스토그램 + 카운터)
+- 샘플링 프로파일러: call_recorded(..., profile=True)면 cProfile 통계를 marshal 바이트로 반환 (pstats로 읽기 가능)
+"""
+
+import cProfile
+import marshal
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+STAGES = ("translate", "layout", "rasterize", "encode", "detect", "grid-fit", "decode")
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# 기록 종류 -> (Prometheus 지표 이름, 라벨 이름, 버킷, 설명)
+_RECORD_METRICS = {
+    "stage": ("braille_stage_seconds", "stage", TIME_BUCKETS, "처리 단계별 소요 시간(초)"),
+    "size": ("braille_request_items", "kind", COUNT_BUCKETS, "요청당 처리한 셀/점 수"),
+}
+
+_recording = ContextVar("braille_metrics_recording", default=None)
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+def _format_labels(labels):
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}" if labels else ""
+
+class MetricsRegistry:
+    """라벨별 히스토그램/카운터 모음 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}  # 이름 -> (설명, 버킷, {라벨: Histogram})
+        self._counters = {}    # 이름 -> (설명, {라벨: 값})
+
+    def observe(self, name, labels, value, buckets=TIME_BUCKETS, help=""):
+        with self._lock:
+            _, bounds, series = self._histograms.setdefault(name, (help, buckets, {}))
+            hist = series.get(labels)
+            if hist is None:
+                hist = series[labels] = Histogram(bounds)
+            hist.observe(value)
+
+    def inc(self, name, labels, amount=1, help=""):
+        with self._lock:
+            _, series = self._counters.setdefault(name, (help, {}))
+            series[labels] = series.get(labels, 0) + amount
+
+    def add_record(self, kind, label, value):
+        name, label_name, buckets, help = _RECORD_METRICS[kind]
+        self.observe(name, ((label_name, label),), value, buckets, help)
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, (help, buckets, series) in sorted(self._histograms.items()):
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} histogram"]
+                for labels, hist in sorted(series.items()):
+                    cumulative = 0
+                    for bound, n in zip(buckets, hist.counts):
+                        cumulative += n
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {hist.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {hist.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+            for name, (help, series) in sorted(self._counters.items()):
+                lines += [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+def _record(kind, label, value):
+    records = _recording.get()
+    if records is not None:
+        records.append((kind, label, value))
+    else:
+        REGISTRY.add_record(kind, label, value)
+
+@contextmanager
+def span(stage):
+    """with span("detect"): ... 또는 @span("encode") 데코레이터로 단계 소요 시간 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record("stage", stage, time.perf_counter() - start)
+
+def observe(kind, value):
+    """요청 규모 기록 (kind: "cells", "dots")"""
+    _record("size", kind, value)
+
+@contextmanager
+def recording():
+    """블록 안의 span/observe 기록을 레지스트리 대신 목록에 모음 (요청 단위 Server-Timing, 프로세스 간 전달용)"""
+    records = []
+    token = _recording.set(records)
+    try:
+        yield records
+    finally:
+        _recording.reset(token)
+
+def replay(records):
+    """call_recorded 등으로 받은 기록을 현재 기록 목록(또는 레지스트리)에 반영"""
+    for record in records:
+        _record(*record)
+
+def commit(records):
+    """기록 목록을 레지스트리에 누적"""
+    for record in records:
+        REGISTRY.add_record(*record)
+
+def call_recorded(fn, args=(), kwargs=None, profile=False):
+    """
+    작업 풀에서 실행할 래퍼: fn(*args, **kwargs) -> (결과, 기록 목록, cProfile 통계 marshal 바이트 또는 None)
+    """
+    profiler = cProfile.Profile() if profile else None
+    with recording() as records:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            result = fn(*args, **(kwargs or {}))
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    stats = None
+    if profiler is not None:
+        profiler.create_stats()
+        stats = marshal.dumps(profiler.stats)
+    return result, records, stats
+
+def server_timing(records):
+    """기록 목록 -> Server-Timing 헤더 값 (단계별 합계, 밀리초)"""
+    totals = {}
+    for kind, label, value in records:
+        if kind == "stage":
+            totals[label] = totals.get(label, 0.0) + value
+    return ", ".join(f"{label};dur={seconds * 1e3:.2f}" for label, seconds in totals.items())
+
+class ProfileSampler:
+    """
+    요청 중 rate 비율만 프로파일링 (opt-in, 기본 0). 통계는 hook(이름, marshal 바이트)으로 전달,
+    hook이 없으면 directory에 <이름>_<시각>_<pid>.prof로 저장 (python -m pstats 파일명으로 확인)
+    """
+
+    def __init__(self, rate=0.0, directory="data/profiles", hook=None):
+        self.rate = rate
+        self.directory = directory
+        self.hook = hook or self._save
+
+    def should_sample(self):
+        return self.rate > 0 and random.random() < self.rate
+
+    def _save(self, name, stats):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.prof")
+        with open(path, "wb") as f:
+            f.write(stats)
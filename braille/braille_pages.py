@@ -0,0 +1,108 @@
+"""
+긴 텍스트의 쪽 단위 점자 렌더링
+- 한 줄 셀 수 x 쪽당 줄 수(예: 점자 표준 32 x 25)로 셀 배열을 쪽으로 나누고 쪽마다 같은 크기 이미지로 렌더링
+- 쪽 렌더링/인코딩은 프로세스 풀에서 병렬 처리, 진행 중 작업 수를 제한하고 완성되는 대로 쪽 순서대로 내보냄
+- 출력: 쪽별 PNG 파일들 또는 멀티페이지 TIFF 하나 (쪽이 완성될 때마다 이어 쓰기)
+- 단일 채널 그레이스케일(기본) 또는 1비트("bilevel") 모드
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .braille_translator import text_to_braille
+from .braille_renderer import cell_geometry, render_braille_cells, encode_braille_raster
+from .braille_tiff import MultiPageTiffWriter, pack_tiff_page
+
+def paginate_cells(cells, cells_per_line=32, lines_per_page=25):
+    """셀 배열 -> 쪽별 셀 배열 목록 (마지막 쪽만 짧을 수 있음)"""
+    page_size = cells_per_line * lines_per_page
+    return [bytes(cells[i:i + page_size]) for i in range(0, len(cells), page_size)] or [b'']
+
+def render_page(page_cells, geometry, cells_per_line=32, lines_per_page=25, mode="gray"):
+    """쪽 셀 배열 -> 빈 셀로 채운 전체 쪽 크기 단일 채널 이미지"""
+    full = page_cells.ljust(cells_per_line * lines_per_page, b'\x00')
+    return render_braille_cells(full, geometry, cells_per_line, mode)
+
+def _render_page_task(task):
+    """
+    작업 단위: (쪽 셀 배열, 셀 규격, 한 줄 셀 수, 쪽당 줄 수, 포맷, 모드, 압축 레벨)
+    -> PNG 등: 인코딩된 바이트 / TIFF: pack_tiff_page 결과
+    """
+    page_cells, geometry, cells_per_line, lines_per_page, ext, mode, compression = task
+    img = render_page(page_cells, geometry, cells_per_line, lines_per_page, mode)
+    if ext in ('.tif', '.tiff'):
+        return pack_tiff_page(img, mode == "bilevel", 6 if compression is None else compression)
+    return encode_braille_raster(img, ext, compression, mode == "bilevel")
+
+def iter_braille_pages(
+    text,
+    dpi=300,
+    cells_per_line=32,
+    lines_per_page=25,
+    ext=".png",
+    workers=None,
+    max_inflight=None,
+    mode="gray",
+    compression=None,
+):
+    """
+    텍스트 -> 쪽별 인코딩 결과를 쪽 순서대로 yield (앞 쪽들이 끝나는 즉시, 문서 전체를 기다리지 않음).
+    ext=".tif"/".tiff" 이면 MultiPageTiffWriter.write_page 용 pack_tiff_page 결과를 yield.
+    """
+    geometry = cell_geometry(dpi)
+    pages = paginate_cells(text_to_braille(text, use_unicode=False), cells_per_line, lines_per_page)
+    tasks = (
+        (page, geometry, cells_per_line, lines_per_page, ext.lower(), mode, compression)
+        for page in pages
+    )
+    if workers == 1 or len(pages) == 1:
+        yield from map(_render_page_task, tasks)
+        return
+    workers = workers or os.cpu_count() or 1
+    max_inflight = max_inflight or workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=min(workers, len(pages))) as pool:
+        for task in tasks:
+            if len(pending) >= max_inflight:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_render_page_task, task))
+        while pending:
+            yield pending.popleft().result()
+
+def save_braille_pages(
+    text,
+    out_path,
+    dpi=300,
+    cells_per_line=32,
+    lines_per_page=25,
+    workers=None,
+    mode="gray",
+    compression=None,
+):
+    """
+    텍스트 -> 쪽 이미지 저장, 저장한 쪽 수 반환.
+    - out_path가 .tif/.tiff: 멀티페이지 TIFF 하나
+    - 그 외: 쪽 번호 서식 경로 (예: "out/page_{:03d}.png", 번호는 1부터).
+      서식 자리가 없으면 "_{:03d}"를 확장자 앞에 붙임 ("out.png" -> out_001.png, out_002.png, ...)
+    """
+    stem, ext = os.path.splitext(out_path)
+    ext = ext.lower()
+    if ext not in ('.tif', '.tiff') and out_path.format(1) == out_path.format(2):
+        # 쪽마다 같은 파일을 덮어쓰지 않도록
+        out_path = stem.replace('{', '{{').replace('}', '}}') + "_{:03d}" + os.path.splitext(out_path)[1]
+    pages = iter_braille_pages(
+        text, dpi, cells_per_line, lines_per_page, ext, workers, mode=mode, compression=compression
+    )
+    if ext in ('.tif', '.tiff'):
+        with MultiPageTiffWriter(out_path, dpi) as writer:
+            for page in pages:
+                writer.write_page(*page)
+        return writer.pages
+    count = 0
+    for count, data in enumerate(pages, 1):
+        path = out_path.format(count)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    return count
@@ -0,0 +1,98 @@
+"""
+점자 셀 배열 → 이미지 래스터라이저 (글리프 아틀라스 방식)
+- 주어진 규격(dpi, 점 지름, 점 간격, 셀 크기)에서 가능한 셀 모양은 64개뿐이므로
+  64개 타일을 한 번만 그려 캐시하고, 페이지는 타일 배열 인덱싱 + reshape로 조립
+- 렌더링 시간이 점 개수와 무관하게 셀 수(픽셀 복사량)에만 비례
+- 흑백 이미지이므로 단일 채널("gray")/1비트("bilevel") 모드는 채널 1개 버퍼에 바로 조립
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import cv2
+
+from .braille_translator import as_cell_array
+from .braille_geometry import DOT_COORDS, CellGeometry, cell_geometry, cell_origin
+from .braille_tiff import encode_tiff
+from .braille_metrics import span
+
+RENDER_MODES = ("bgr", "gray", "bilevel")
+
+def draw_braille_cell(img, x0, y0, pattern, point_r, xgap, ygap, dot_color=(0,0,0)):
+    """pattern: 셀 비트마스크(0~63)"""
+    for idx, (dx, dy) in enumerate(DOT_COORDS):
+        if (pattern >> idx) & 1:
+            cx = int(round(x0 + dx * xgap))
+            cy = int(round(y0 + dy * ygap))
+            cv2.circle(img, (cx, cy), point_r, dot_color, -1, lineType=cv2.LINE_AA)
+
+@lru_cache(maxsize=16)
+def get_cell_atlas(geometry, mode="bgr"):
+    """
+    64개 셀 타일 아틀라스. 규격/모드별로 캐시되며 읽기 전용.
+    - "bgr": (64, cell_h, cell_w, 3) 안티에일리어싱 컬러
+    - "gray": (64, cell_h, cell_w) 같은 모양의 단일 채널
+    - "bilevel": (64, cell_h, cell_w) 0/255 흑백 (1비트 출력용)
+    """
+    if mode == "bgr":
+        atlas = np.full((64, geometry.cell_h, geometry.cell_w, 3), 255, dtype=np.uint8)
+        x0, y0 = cell_origin(geometry)
+        for mask in range(1, 64):
+            draw_braille_cell(atlas[mask], x0, y0, mask, geometry.point_r, geometry.xgap, geometry.ygap)
+    elif mode == "gray":
+        atlas = get_cell_atlas(geometry, "bgr")[..., 0].copy()  # 검은 점 / 흰 배경이라 B=G=R
+    elif mode == "bilevel":
+        atlas = np.where(get_cell_atlas(geometry, "gray") >= 128, 255, 0).astype(np.uint8)
+    else:
+        raise ValueError(f"지원하지 않는 렌더링 모드: {mode} ({', '.join(RENDER_MODES)})")
+    atlas.flags.writeable = False
+    return atlas
+
+def render_braille_cells(cells, geometry=None, max_cols=20, mode="bgr"):
+    """
+    셀 배열 -> 점자 이미지 uint8 ("bgr": (H, W, 3), "gray"/"bilevel": (H, W) 단일 채널).
+    한 줄에 max_cols 셀, 마지막 줄 남는 칸은 빈 셀.
+    """
+    if geometry is None:
+        geometry = cell_geometry()
+    with span("layout"):
+        atlas = get_cell_atlas(geometry, mode)
+        cells = np.frombuffer(as_cell_array(cells), dtype=np.uint8)
+        ncell = len(cells)
+        ncol = min(ncell, max_cols)
+        nrow = (ncell + max_cols - 1) // max_cols
+        grid = np.zeros(nrow * ncol, dtype=np.uint8)
+        grid[:ncell] = cells
+        grid = grid.reshape(nrow, ncol)
+    with span("rasterize"):
+        channels = atlas.shape[3:]
+        img = np.empty((nrow * geometry.cell_h, ncol * geometry.cell_w) + channels, dtype=np.uint8)
+        # (줄, 셀 높이, 칸, 셀 너비[, 채널]) 뷰에 줄 단위로 타일 블록 배치
+        blocks = img.reshape((nrow, geometry.cell_h, ncol, geometry.cell_w) + channels)
+        for row in range(nrow):
+            blocks[row] = atlas[grid[row]].swapaxes(0, 1)
+    return img
+
+@span("encode")
+def encode_braille_raster(img, ext=".png", compression=None, bilevel=False, dpi=300):
+    """
+    렌더링 이미지 -> 인코딩 바이트
+    - ".png": compression = zlib 압축 레벨(0~9, 기본 OpenCV 값), bilevel이면 1비트 PNG
+    - ".webp": 무손실
+    - ".tif"/".tiff": 단일 채널이면 Deflate TIFF (bilevel이면 1비트 패킹, compression = 압축 레벨)
+    - 그 외: cv2.imencode 기본값
+    """
+    params = []
+    if ext == ".png":
+        if compression is not None:
+            params += [cv2.IMWRITE_PNG_COMPRESSION, compression]
+        if bilevel:
+            params += [cv2.IMWRITE_PNG_BILEVEL, 1]
+    elif ext == ".webp":
+        params += [cv2.IMWRITE_WEBP_QUALITY, 101]  # 100 초과 = 무손실
+    elif ext in (".tif", ".tiff") and img.ndim == 2:
+        return encode_tiff(img, bilevel, 6 if compression is None else compression, dpi)
+    ok, buf = cv2.imencode(ext, img, params)
+    if not ok:
+        raise ValueError(f"이미지 인코딩 실패: {ext}")
+    return buf.tobytes()
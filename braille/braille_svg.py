@@ -0,0 +1,57 @@
+"""
+점자 셀 배열 → SVG 벡터 렌더러
+- 래스터 렌더러와 같은 셀 규격(CellGeometry: 점 반지름, 점 간격, 셀 크기)과 배치를 사용
+- 실제로 쓰인 셀 모양만 <symbol>로 한 번 정의하고 각 셀은 <use>로 참조 (최대 64개 모양 공유)
+  (SVG 1.1 뷰어/변환기(librsvg, 구형 Safari) 호환을 위해 href와 xlink:href를 함께 기록)
+- 줄마다 <g transform>으로 y를 묶고 빈 셀은 생략 → 셀당 수십 바이트, 래스터 인코딩 비용 없음
+- viewBox는 픽셀 좌표, width/height는 mm 단위라 인쇄 시 실제 점자 크기로 출력
+"""
+
+from .braille_translator import as_cell_array
+from .braille_geometry import DOT_COORDS, cell_geometry, cell_origin
+from .braille_metrics import span
+
+SVG_MIMETYPE = "image/svg+xml"
+
+def _cell_symbol(mask, geometry):
+    """셀 비트마스크 -> <symbol id="cN"> (셀 좌상단 기준 좌표의 점 원들)"""
+    x0, y0 = cell_origin(geometry)
+    dots = "".join(
+        f'<circle cx="{int(round(x0 + dx * geometry.xgap))}" cy="{int(round(y0 + dy * geometry.ygap))}" '
+        f'r="{geometry.point_r}"/>'
+        for idx, (dx, dy) in enumerate(DOT_COORDS) if (mask >> idx) & 1
+    )
+    return f'<symbol id="c{mask}" overflow="visible">{dots}</symbol>'
+
+@span("encode")
+def render_braille_svg(cells, dpi=300, max_cols=20, geometry=None):
+    """셀 배열 -> SVG 문서 문자열. 배치/크기는 render_braille_cells 결과 이미지와 동일."""
+    if geometry is None:
+        geometry = cell_geometry(dpi)
+    cells = as_cell_array(cells)
+    ncell = len(cells)
+    ncol = min(ncell, max_cols)
+    nrow = (ncell + max_cols - 1) // max_cols
+    width = ncol * geometry.cell_w
+    height = nrow * geometry.cell_h
+    mm = 25.4 / dpi
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width * mm:.2f}mm" height="{height * mm:.2f}mm" '
+        f'viewBox="0 0 {width} {height}">',
+        '<defs>',
+        *(_cell_symbol(mask, geometry) for mask in sorted(set(cells) - {0})),
+        '</defs>',
+        f'<rect width="{width}" height="{height}" fill="#fff"/>',
+        '<g fill="#000">',
+    ]
+    for row in range(nrow):
+        line = cells[row * max_cols:(row + 1) * max_cols]
+        uses = "".join(
+            f'<use href="#c{mask}" xlink:href="#c{mask}" x="{col * geometry.cell_w}"/>'
+            for col, mask in enumerate(line) if mask
+        )
+        if uses:
+            parts.append(f'<g transform="translate(0 {row * geometry.cell_h})">{uses}</g>')
+    parts.append('</g></svg>')
+    return "\n".join(parts)
@@ -0,0 +1,372 @@
+"""
+점자 매핑 테이블 컴파일러 / 로더
+- 원본: data/braille_table.json (또는 같은 형식의 사용자 테이블 JSON)
+- 컴파일 결과: 버전이 붙은 바이너리 아티팩트 (기본 data/braille_table.bin)
+    - 정방향: 한글 음절 11,172자의 셀 배열 (오프셋 배열 + 셀 바이트), 영문/숫자/특수문자/공백 셀
+    - 역방향: braille_to_text 상태 머신용 64/4096칸 배열 (약자, 음절 기준 코드포인트, 종성 오프셋, 대문자, 숫자, 단독 셀)
+    - 약자 목록과 원본 JSON(느린 경로용) 포함
+- 로드: 파일을 읽기 전용 mmap으로 열어 섹션을 memoryview로 참조 → prefork 서버의 여러 프로세스가 같은 페이지 공유,
+  한글 음절은 처음 나온 글자만 프로세스별 str.translate 테이블에 캐시 (import 시 11,172자 테이블 생성 없음)
+- 원본 JSON이 아티팩트보다 새로우면(원본 해시 불일치) 메모리에서 다시 컴파일해 사용
+
+실행: python -m braille.braille_table_compiler [원본.json] [-o 출력.bin]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import warnings
+
+from .braille_abbreviation import build_abbreviation_trie
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_SOURCE = os.path.join(_DATA_DIR, "braille_table.json")
+DEFAULT_ARTIFACT = os.path.join(_DATA_DIR, "braille_table.bin")
+
+MAGIC = b"BRLTABLE"
+FORMAT_VERSION = 1
+# 헤더: 매직, 포맷 버전, 섹션 수, 테이블 버전(정방향 매핑 해시, ASCII), 원본 JSON 바이트 SHA-1
+_HEADER = struct.Struct("<8sII16s20s")
+# 섹션 목록 항목: 이름, 파일 내 오프셋, 길이
+_SECTION = struct.Struct("<8sII")
+
+SOURCE_KEYS = (
+    'INITIAL_TO_BRAILLE', 'MEDIAL_TO_BRAILLE', 'FINAL_TO_BRAILLE',
+    'HANGUL_BRAILLE_ABBREVIATION', 'ENGLISH_TO_BRAILLE', 'SPECIAL_TO_BRAILLE',
+    'CAPITAL_PREFIX', 'NUMBER_PREFIX', 'NUM_TO_BRAILLE_LETTER',
+)
+
+# --- 한글 음절 분해용 자모 순서 (유니코드 U+AC00 배열 순서) ---
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+HANGUL_INITIALS = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+HANGUL_MEDIALS = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+HANGUL_FINALS = (
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+_WHITESPACE = ' \t\n\r\x0b\x0c'
+_NONE = ''  # 문자열 배열에서 None(해당 없음) 표시 (빈 문자열은 값으로 쓰이지 않음)
+
+def bits_to_mask(bits):
+    """6비트 리스트 -> 셀 비트마스크(0~63, 점1=bit0 ... 점6=bit5)"""
+    code = 0
+    for i, bit in enumerate(bits):
+        if bit:
+            code |= (1 << i)
+    return code
+
+def _as_cells(bits):
+    """단일 셀([..6..]) 또는 복합 셀([[..], [..]]) 값을 셀 리스트로 정규화"""
+    return bits if isinstance(bits[0], list) else [bits]
+
+def _to_mask_str(bits):
+    """단일/복합 셀 값 -> 셀 마스크 문자열(셀 1개 = latin-1 문자 1개)"""
+    return ''.join(chr(bits_to_mask(b)) for b in _as_cells(bits))
+
+def table_version(source):
+    """정방향 매핑 내용 해시 (캐시 키 등에 사용)"""
+    forward = {k: source[k] for k in SOURCE_KEYS}
+    src = json.dumps(forward, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(src.encode('utf-8')).hexdigest()[:12]
+
+# ---------------------- 컴파일 ----------------------
+
+def _hangul_cells(source):
+    """한글 음절 순서대로 셀 마스크 문자열 목록 (초성 * 588 + 중성 * 28 + 종성)"""
+    initial, medial, final = source['INITIAL_TO_BRAILLE'], source['MEDIAL_TO_BRAILLE'], source['FINAL_TO_BRAILLE']
+    cells = []
+    for cho in HANGUL_INITIALS:
+        cho_cells = _to_mask_str(initial[cho]) if cho in initial else ''
+        for jung in HANGUL_MEDIALS:
+            head = cho_cells + (_to_mask_str(medial[jung]) if jung in medial else '')
+            for jong in HANGUL_FINALS:
+                cells.append(head + _to_mask_str(final[jong]) if jong in final else head)
+    return cells
+
+def _other_chars(source):
+    """영문 대/소문자, 숫자, 특수문자, 공백 -> 셀 마스크 문자열"""
+    english = source['ENGLISH_TO_BRAILLE']
+    capital = _to_mask_str(source['CAPITAL_PREFIX'])
+    number = _to_mask_str(source['NUMBER_PREFIX'])
+    table = {}
+    for lower, bits in english.items():
+        table[lower] = _to_mask_str(bits)
+        table[lower.upper()] = capital + _to_mask_str(bits)
+    for digit, letter in source['NUM_TO_BRAILLE_LETTER'].items():
+        table[digit] = number + _to_mask_str(english[letter])
+    for ch, bits in source['SPECIAL_TO_BRAILLE'].items():
+        table.setdefault(ch, _to_mask_str(bits))
+    for ch in _WHITESPACE:
+        table[ch] = '\x00'
+    return table
+
+def _mask_table(mapping, default=None):
+    """{문자: 단일 셀 값} -> 64칸 리스트 [마스크 -> 문자]. 값이 같으면 뒤의 항목 우선 (복합 셀은 제외)"""
+    table = [default] * 64
+    for k, v in mapping.items():
+        if not isinstance(v[0], list):
+            table[bits_to_mask(v)] = k
+    return table
+
+def _decode_tables(source):
+    """braille_to_text 상태 머신용 테이블 -> (약자, 음절 기준, 종성 오프셋, 대문자, 숫자, 단독 셀)"""
+    abbreviation = _mask_table(source['HANGUL_BRAILLE_ABBREVIATION'])
+    english = _mask_table(source['ENGLISH_TO_BRAILLE'])
+    special = _mask_table(source['SPECIAL_TO_BRAILLE'])
+    initial = _mask_table(source['INITIAL_TO_BRAILLE'])
+    medial = _mask_table(source['MEDIAL_TO_BRAILLE'])
+    final = _mask_table(source['FINAL_TO_BRAILLE'], default='')
+    letter_to_digit = {v: k for k, v in source['NUM_TO_BRAILLE_LETTER'].items()}
+
+    # 한글 조합: (초성 셀 << 6 | 중성 셀) -> 음절 기준 코드포인트(0: 조합 불가),
+    # 종성 셀 -> 코드포인트 오프셋. 음절 = chr(기준 + 오프셋)
+    syllable_base = [0] * 4096
+    for ci, cho in enumerate(initial):
+        if cho is None or cho not in HANGUL_INITIALS:
+            continue
+        for mi, jung in enumerate(medial):
+            if jung is None or jung not in HANGUL_MEDIALS:
+                continue
+            syllable_base[(ci << 6) | mi] = (
+                HANGUL_BASE + (HANGUL_INITIALS.index(cho) * 21 + HANGUL_MEDIALS.index(jung)) * 28
+            )
+    final_offset = [HANGUL_FINALS.index(jong) if jong in HANGUL_FINALS else 0 for jong in final]
+
+    # 단독 셀(영문 > 특수문자 > 공백 > 미정의) 복원 문자
+    single = [english[m] or special[m] or (' ' if m == 0 else '?') for m in range(64)]
+    capital = [(ch or '?').upper() for ch in english]
+    digit = [letter_to_digit.get(ch) for ch in english]
+    return abbreviation, syllable_base, final_offset, capital, digit, single
+
+def _pack_strings(strings):
+    """문자열 목록 -> 개수(u32) + 오프셋(u32 x 개수+1) + UTF-8 바이트. None은 _NONE으로 저장"""
+    blobs = [(_NONE if s is None else s).encode('utf-8') for s in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return struct.pack(f"<I{len(offsets)}I", len(blobs), *offsets) + b''.join(blobs)
+
+def _unpack_strings(view):
+    count = struct.unpack_from("<I", view)[0]
+    offsets = struct.unpack_from(f"<{count + 1}I", view, 4)
+    # 오프셋은 UTF-8 바이트 기준이므로 바이트 단위로 자른 뒤 디코딩
+    raw = bytes(view[4 + 4 * (count + 1):])
+    strings = [raw[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(count)]
+    return [None if s == _NONE else s for s in strings]
+
+def compile_tables(source, source_bytes=None):
+    """원본 테이블(dict) -> 아티팩트 바이트"""
+    missing = [k for k in SOURCE_KEYS if k not in source]
+    if missing:
+        raise ValueError(f"점자 테이블에 필요한 항목이 없습니다: {', '.join(missing)}")
+    if source_bytes is None:
+        source_bytes = json.dumps(source, ensure_ascii=False).encode('utf-8')
+    hangul = _hangul_cells(source)
+    hangul_offsets = [0]
+    for cells in hangul:
+        hangul_offsets.append(hangul_offsets[-1] + len(cells))
+    others = _other_chars(source)
+    abbreviations = {k: _to_mask_str(v) for k, v in source['HANGUL_BRAILLE_ABBREVIATION'].items() if k}
+    abbreviation, syllable_base, final_offset, capital, digit, single = _decode_tables(source)
+
+    sections = [
+        (b"SOURCE", source_bytes),
+        (b"HGOFFS", struct.pack(f"<{len(hangul_offsets)}I", *hangul_offsets)),
+        (b"HGCELLS", ''.join(hangul).encode('latin-1')),
+        (b"CHARS", _pack_strings(list(others))),
+        (b"CHCELLS", _pack_strings(list(others.values()))),
+        (b"ABWORDS", _pack_strings(list(abbreviations))),
+        (b"ABCELLS", _pack_strings(list(abbreviations.values()))),
+        (b"DABBR", _pack_strings(abbreviation)),
+        (b"DSYLL", struct.pack("<4096I", *syllable_base)),
+        (b"DFINAL", bytes(final_offset)),
+        (b"DCAP", _pack_strings(capital)),
+        (b"DDIGIT", _pack_strings(digit)),
+        (b"DSINGLE", _pack_strings(single)),
+    ]
+    header_size = _HEADER.size + _SECTION.size * len(sections)
+    directory = []
+    body = bytearray()
+    for name, data in sections:
+        body += b'\x00' * (-(header_size + len(body)) % 4)  # u32 배열 정렬
+        directory.append(_SECTION.pack(name, header_size + len(body), len(data)))
+        body += data
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(sections),
+        table_version(source).encode('ascii'), hashlib.sha1(source_bytes).digest(),
+    )
+    return header + b''.join(directory) + bytes(body)
+
+def compile_file(src_path=DEFAULT_SOURCE, dst_path=DEFAULT_ARTIFACT):
+    """JSON 테이블 파일 -> 아티팩트 파일 (임시 파일에 쓴 뒤 교체: 기존 파일을 mmap 중인 프로세스에 영향 없음)"""
+    with open(src_path, 'rb') as f:
+        source_bytes = f.read()
+    data = compile_tables(json.loads(source_bytes), source_bytes)
+    directory = os.path.dirname(os.path.abspath(dst_path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 0600으로 만들므로, 다른 사용자로 실행되는 서버도 읽을 수 있게 일반 파일 권한으로
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, dst_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return table_version(json.loads(source_bytes))
+
+# ---------------------- 로드 ----------------------
+
+def _decompose_hangul(ch):
+    """한글 음절/자모 1개 -> (초성, 중성, 종성), 한글이 아니면 (None, None, None)"""
+    import hgtk
+    try:
+        return hgtk.letter.decompose(ch)
+    except hgtk.exception.NotHangulException:
+        return None, None, None
+
+# 느린 경로 결과를 캐시할 한글 자모(호환용 자모) 범위. 이 범위와 한글 음절만 캐시해 테이블 크기를 제한
+HANGUL_JAMO_FIRST = 0x3131
+HANGUL_JAMO_LAST = 0x318E
+
+class _TranslateTable(dict):
+    """
+    str.translate용 {코드포인트: 셀 마스크 문자열}. 없는 문자는 아티팩트(한글 음절) 또는 느린 경로로 계산.
+    한글 음절/자모만 캐시 (최대 11,172 + 94자) — 임의의 유니코드 입력으로 캐시가 무한히 커지지 않도록 나머지는 매번 계산
+    """
+
+    def __init__(self, tables, items):
+        super().__init__(items)
+        self._tables = tables
+
+    def __missing__(self, code):
+        value = self._tables.lookup(code)
+        if HANGUL_BASE <= code <= HANGUL_LAST or HANGUL_JAMO_FIRST <= code <= HANGUL_JAMO_LAST:
+            self[code] = value
+        return value
+
+class CompiledTables:
+    """아티팩트 버퍼(mmap 또는 bytes)를 해석한 변환/복원 테이블 묶음 (읽기 전용, 교체 단위)"""
+
+    def __init__(self, buffer, path=None):
+        self.path = path
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, fmt, nsections, version, source_sha1 = _HEADER.unpack_from(view)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 점자 테이블 아티팩트입니다: {path}")
+        self.version = version.rstrip(b'\x00').decode('ascii')
+        self.source_sha1 = source_sha1
+        sections = {}
+        for i in range(nsections):
+            name, offset, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            sections[name.rstrip(b'\x00').decode('ascii')] = view[offset:offset + length]
+
+        self.source = json.loads(bytes(sections["SOURCE"]).decode('utf-8'))
+        self._hangul_offsets = sections["HGOFFS"].cast('I')
+        self._hangul_cells = sections["HGCELLS"]
+        others = dict(zip(_unpack_strings(sections["CHARS"]), _unpack_strings(sections["CHCELLS"])))
+        self.translate_table = _TranslateTable(self, ((ord(ch), cells) for ch, cells in others.items()))
+
+        self.abbreviations = dict(zip(_unpack_strings(sections["ABWORDS"]), _unpack_strings(sections["ABCELLS"])))
+        self.max_abbreviation_len = max((len(k) for k in self.abbreviations), default=0)
+        # 약자 트라이 (값: 셀 마스크 문자열) 및 약자 후보 시작 문자 검색용 정규식
+        self.abbreviation_trie = build_abbreviation_trie(self.abbreviations)
+        self.abbreviation_start = (
+            re.compile('[' + ''.join(re.escape(ch) for ch in self.abbreviation_trie) + ']')
+            if self.abbreviation_trie else None
+        )
+
+        self.decode_abbreviation = _unpack_strings(sections["DABBR"])
+        # 복원 상태 머신에서 셀마다 조회하는 작은 배열(4096/64칸)은 리스트로 복사 (memoryview 인덱싱은 약 2배 느림)
+        self.decode_syllable_base = sections["DSYLL"].cast('I').tolist()
+        self.decode_final_offset = list(sections["DFINAL"])
+        self.decode_capital = _unpack_strings(sections["DCAP"])
+        self.decode_digit = _unpack_strings(sections["DDIGIT"])
+        self.decode_single = _unpack_strings(sections["DSINGLE"])
+        self.capital_prefix_mask = bits_to_mask(self.source['CAPITAL_PREFIX'])
+        self.number_prefix_mask = bits_to_mask(self.source['NUMBER_PREFIX'])
+
+    def lookup(self, code):
+        """코드포인트 1개 -> 셀 마스크 문자열 (한글 음절은 아티팩트에서, 그 외 미등록 문자는 원본 테이블로 계산)"""
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            i = code - HANGUL_BASE
+            return self._hangul_cells[self._hangul_offsets[i]:self._hangul_offsets[i + 1]].tobytes().decode('latin-1')
+        return ''.join(chr(bits_to_mask(b)) for b in self.char_to_cells(chr(code)))
+
+    def char_to_cells(self, ch):
+        """룩업 테이블에 없는 문자 1개 -> 점자 셀 리스트 (자모/기타 유니코드용 느린 경로)"""
+        source = self.source
+        cells = []
+        cho, jung, jong = _decompose_hangul(ch)
+        if cho is not None:
+            if cho in source['INITIAL_TO_BRAILLE']:
+                cells.append(source['INITIAL_TO_BRAILLE'][cho])
+            if jung in source['MEDIAL_TO_BRAILLE']:
+                cells.append(source['MEDIAL_TO_BRAILLE'][jung])
+            if jong is not None and jong in source['FINAL_TO_BRAILLE']:
+                cells.extend(_as_cells(source['FINAL_TO_BRAILLE'][jong]))
+            return cells
+        # 영문자 (대소문자 구분)
+        if ch.isalpha():
+            if ch.isupper():
+                cells.append(source['CAPITAL_PREFIX'])
+            cells.append(source['ENGLISH_TO_BRAILLE'].get(ch.lower(), [0,0,0,0,0,0]))
+            return cells
+        # 숫자 (ASCII 외 숫자는 미정의 문자로 처리)
+        if ch in source['NUM_TO_BRAILLE_LETTER']:
+            cells.append(source['NUMBER_PREFIX'])
+            cells.append(source['ENGLISH_TO_BRAILLE'][source['NUM_TO_BRAILLE_LETTER'][ch]])
+            return cells
+        # 특수문자
+        if ch in source['SPECIAL_TO_BRAILLE']:
+            return [source['SPECIAL_TO_BRAILLE'][ch]]
+        # 공백 및 정의되지 않은 문자
+        return [[0,0,0,0,0,0]]
+
+def _read_source(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def load_tables(path=None):
+    """
+    테이블 로드 -> CompiledTables.
+    - path 미지정: 환경 변수 BRAILLE_TABLE, 없으면 기본 아티팩트 (data/braille_table.bin)
+    - .json 경로: 메모리에서 컴파일
+    - 기본 아티팩트가 없거나 data/braille_table.json과 해시가 다르면 JSON을 메모리에서 컴파일 (경고 출력)
+    """
+    path = path or os.environ.get("BRAILLE_TABLE") or DEFAULT_ARTIFACT
+    if path.endswith(".json"):
+        source_bytes = _read_source(path)
+        return CompiledTables(compile_tables(json.loads(source_bytes), source_bytes), path)
+    if not os.path.exists(path) and path == DEFAULT_ARTIFACT:
+        warnings.warn("점자 테이블 아티팩트가 없어 원본 JSON을 컴파일합니다: python -m braille.braille_table_compiler")
+        return load_tables(DEFAULT_SOURCE)
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    tables = CompiledTables(buffer, path)
+    if path == DEFAULT_ARTIFACT and os.path.exists(DEFAULT_SOURCE):
+        if hashlib.sha1(_read_source(DEFAULT_SOURCE)).digest() != tables.source_sha1:
+            warnings.warn(f"{DEFAULT_SOURCE}가 아티팩트보다 새로워 메모리에서 다시 컴파일합니다")
+            return load_tables(DEFAULT_SOURCE)
+    return tables
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="점자 테이블 JSON -> 바이너리 아티팩트 컴파일")
+    parser.add_argument("src", nargs="?", default=DEFAULT_SOURCE, help="원본 테이블 JSON (기본: data/braille_table.json)")
+    parser.add_argument("-o", "--output", help="출력 경로 (기본: 원본과 같은 폴더의 .bin)")
+    args = parser.parse_args(argv)
+    out = args.output or os.path.splitext(args.src)[0] + ".bin"
+    version = compile_file(args.src, out)
+    print(f"[✔] {args.src} -> {out} (테이블 버전 {version}, {os.path.getsize(out)} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+그레이스케일/1비트 TIFF 인코더 (외부 라이브러리 없이 Deflate 단일 스트립)
+- OpenCV는 1비트 샘플 TIFF(및 그 전제인 CCITT G4)를 쓰지 못하므로 점자처럼 흑백뿐인 이미지는
+  행 단위 비트 패킹(np.packbits) + Deflate로 직접 기록
+- 멀티페이지: 쪽마다 픽셀 데이터 뒤에 IFD를 쓰고 직전 IFD의 다음 IFD 포인터만 되돌아가 갱신 → 쪽 단위 이어 쓰기
+"""
+
+import io
+import os
+import struct
+import zlib
+
+import numpy as np
+
+def pack_tiff_page(img, bilevel=False, level=6):
+    """
+    그레이스케일 uint8 이미지 -> (너비, 높이, 샘플 비트 수, Deflate 압축 픽셀).
+    bilevel=True 이면 0이 아닌 픽셀을 흰색(1)으로 한 1비트 행 패킹.
+    """
+    height, width = img.shape
+    if bilevel:
+        data = np.packbits(img != 0, axis=1).tobytes()
+        bits = 1
+    else:
+        data = np.ascontiguousarray(img).tobytes()
+        bits = 8
+    return width, height, bits, zlib.compress(data, level)
+
+class MultiPageTiffWriter:
+    """
+    멀티페이지 TIFF(리틀 엔디언, BlackIsZero, Deflate 단일 스트립)를 쪽 단위로 이어 쓰기.
+    target은 경로 또는 쓰기/탐색 가능한 바이너리 파일 객체. 전체 쪽을 메모리에 모으지 않음.
+    """
+
+    def __init__(self, target, dpi=300):
+        self.dpi = dpi
+        self.pages = 0
+        self._own = isinstance(target, (str, os.PathLike))
+        self._f = open(target, 'wb') if self._own else target
+        self._start = self._f.tell()
+        self._f.write(b'II*\x00\x00\x00\x00\x00')
+        self._next_ptr = 4  # 다음 IFD 오프셋을 기록할 위치 (처음에는 헤더)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._own:
+            self._f.close()
+
+    def _tell(self):
+        """파일 시작(헤더) 기준 현재 오프셋, 워드 경계로 정렬"""
+        if (self._f.tell() - self._start) % 2:
+            self._f.write(b'\x00')
+        return self._f.tell() - self._start
+
+    def write_page(self, width, height, bits, compressed):
+        """pack_tiff_page 결과 (너비, 높이, 샘플 비트 수, Deflate 압축 픽셀) 한 쪽 추가"""
+        f = self._f
+        strip = self._tell()
+        f.write(compressed)
+        resolution = self._tell()
+        f.write(struct.pack('<IIII', self.dpi, 1, self.dpi, 1))
+        SHORT, LONG, RATIONAL = 3, 4, 5
+        entries = [
+            (256, LONG, width),                 # ImageWidth
+            (257, LONG, height),                # ImageLength
+            (258, SHORT, bits),                 # BitsPerSample
+            (259, SHORT, 8),                    # Compression = Deflate
+            (262, SHORT, 1),                    # PhotometricInterpretation = BlackIsZero
+            (273, LONG, strip),                 # StripOffsets
+            (277, SHORT, 1),                    # SamplesPerPixel
+            (278, LONG, height),                # RowsPerStrip
+            (279, LONG, len(compressed)),       # StripByteCounts
+            (282, RATIONAL, resolution),        # XResolution
+            (283, RATIONAL, resolution + 8),    # YResolution
+            (296, SHORT, 2),                    # ResolutionUnit = inch
+        ]
+        ifd = self._tell()
+        f.write(struct.pack('<H', len(entries)))
+        for tag, typ, value in entries:
+            packed = struct.pack('<H2x', value) if typ == SHORT else struct.pack('<I', value)
+            f.write(struct.pack('<HHI', tag, typ, 1) + packed)
+        next_ptr = ifd + 2 + 12 * len(entries)
+        f.write(b'\x00\x00\x00\x00')
+        end = f.tell()
+        f.seek(self._start + self._next_ptr)
+        f.write(struct.pack('<I', ifd))
+        f.seek(end)
+        self._next_ptr = next_ptr
+        self.pages += 1
+
+def encode_tiff(img, bilevel=False, level=6, dpi=300):
+    """그레이스케일 이미지 한 장 -> TIFF 바이트"""
+    buf = io.BytesIO()
+    with MultiPageTiffWriter(buf, dpi) as writer:
+        writer.write_page(*pack_tiff_page(img, bilevel, level))
+    return buf.getvalue()
@@ -0,0 +1,223 @@
+"""
+초대형(세로로 이어 붙인 스캔 등) 점자 이미지의 타일 분할 복원
+- 이미지를 통째로 읽지 않음: 메모리 매핑(.npy, 바이너리 PGM/PPM)으로 크기/축소본만 보고
+  작업 프로세스는 자기 타일(가로 띠)만 파일에서 직접 읽음
+- 타일은 셀 줄 경계에 맞추고 점 크기만큼 겹쳐 잘라 프로세스 풀에서 점 검출
+- 각 타일은 자기 소유 구간(겹침 제외)에 중심이 있는 점만 반환 → 중복 제거 후 타일 순서대로 병합
+- 점 위치 조회도 셀 줄 묶음 단위 점유 마스크로 처리해 최대 메모리가 타일 크기에 비례
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import cv2
+
+from .braille_translator import braille_to_text
+from .braille_renderer import cell_geometry
+from .braille_decoder import (
+    detect_dots, locate_braille_region, estimate_grid_layout, grid_layout,
+    layout_dot_positions, dot_occupancy_mask, lookup_dots, hits_to_cells,
+)
+
+MMAP_EXTENSIONS = ('.npy', '.pgm', '.ppm', '.pnm')
+
+def _read_pnm_header(path):
+    """바이너리 PGM(P5)/PPM(P6) 헤더 -> (채널 수, 높이, 너비, 최댓값, 데이터 시작 오프셋)"""
+    with open(path, 'rb') as f:
+        head = f.read(1024)
+    magic = head[:2]
+    if magic not in (b'P5', b'P6'):
+        raise ValueError(f"바이너리 PGM/PPM(P5/P6)만 지원합니다: {path}")
+    fields = []
+    pos = 2
+    while len(fields) < 3:
+        while head[pos:pos + 1].isspace():
+            pos += 1
+        if head[pos:pos + 1] == b'#':  # 주석은 줄 끝까지
+            pos = head.index(b'\n', pos) + 1
+            continue
+        end = pos
+        while not head[end:end + 1].isspace():
+            end += 1
+        fields.append(int(head[pos:end]))
+        pos = end
+    width, height, maxval = fields
+    return (1 if magic == b'P5' else 3), height, width, maxval, pos + 1
+
+def open_image_memmap(path):
+    """
+    이미지를 메모리 매핑한 읽기 전용 배열 (H, W) 또는 (H, W, 3). 픽셀은 슬라이스한 부분만 디스크에서 읽힘.
+    .npy(채널 순서 BGR), 바이너리 PGM/PPM(P5/P6, 채널 순서 RGB) 지원.
+    PNG/JPEG 등 압축 이미지는 cv2.imwrite(경로.pgm, 이미지)로 한 번 변환해 사용.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        return np.load(path, mmap_mode='r')
+    if ext in ('.pgm', '.ppm', '.pnm'):
+        channels, height, width, maxval, offset = _read_pnm_header(path)
+        dtype = np.uint8 if maxval < 256 else np.dtype('>u2')
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        img = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape)
+        return img if maxval == 255 else _PnmScaled(img, maxval)
+    raise ValueError(f"메모리 매핑을 지원하지 않는 형식입니다({', '.join(MMAP_EXTENSIONS)}): {path}")
+
+class _PnmScaled:
+    """최댓값이 255가 아닌 PGM/PPM: 슬라이스한 부분만 0~255 uint8로 환산"""
+
+    def __init__(self, img, maxval):
+        self.raw = img
+        self.maxval = maxval
+        self.shape = img.shape
+
+    def scale(self, part):
+        return np.rint(np.asarray(part, dtype=np.float32) * (255.0 / self.maxval)).astype(np.uint8)
+
+    def __getitem__(self, index):
+        return self.scale(self.raw[index])
+
+@lru_cache(maxsize=4)
+def _worker_image(path):
+    """작업 프로세스별로 한 번만 헤더 해석/매핑"""
+    return open_image_memmap(path)
+
+def read_image_rows(path, y0, y1):
+    """
+    [y0, y1) 가로 띠만 파일에서 직접 읽기. 메모리 매핑 슬라이스와 달리 읽은 페이지가
+    프로세스에 누적 매핑되지 않아 작업 프로세스 메모리가 띠 크기로 제한됨.
+    """
+    img = _worker_image(path)
+    raw = img.raw if isinstance(img, _PnmScaled) else img
+    if not raw.flags.c_contiguous:
+        raise ValueError(f"행 우선(C 순서) 배열만 지원합니다: {path}")
+    row_items = int(np.prod(raw.shape[1:]))
+    part = np.fromfile(
+        path, dtype=raw.dtype, count=(y1 - y0) * row_items,
+        offset=raw.offset + y0 * row_items * raw.dtype.itemsize,
+    ).reshape((y1 - y0,) + raw.shape[1:])
+    return img.scale(part) if isinstance(img, _PnmScaled) else part
+
+def _to_gray(part, path):
+    """타일(복사본) -> 그레이스케일 uint8. PGM/PPM은 RGB, .npy는 BGR 순서."""
+    part = np.ascontiguousarray(part)
+    if part.ndim == 2:
+        return part
+    rgb = os.path.splitext(path)[1].lower() != '.npy'
+    return cv2.cvtColor(part, cv2.COLOR_RGB2GRAY if rgb else cv2.COLOR_BGR2GRAY)
+
+def _detect_tile(task):
+    """
+    타일 하나의 점 검출 (프로세스 풀 작업 단위).
+    task: (경로, 읽기 시작 y, 읽기 끝 y, 소유 시작 y, 소유 끝 y)
+    소유 구간에 중심이 있는 점만 전체 좌표로 반환 → 겹침 영역 중복 제거.
+    """
+    path, y0, y1, own0, own1 = task
+    tile = _to_gray(read_image_rows(path, y0, y1), path)
+    centers, radii = detect_dots(tile)
+    centers[:, 1] += y0
+    keep = (centers[:, 1] >= own0) & (centers[:, 1] < own1)
+    return centers[keep], radii[keep]
+
+def _tile_tasks(path, height, tile_h, overlap):
+    """[0, height)를 tile_h 간격 소유 구간으로 나누고 위아래로 overlap 만큼 겹친 읽기 구간 생성"""
+    tasks = []
+    for own0 in range(0, height, tile_h):
+        own1 = min(own0 + tile_h, height)
+        tasks.append((path, max(own0 - overlap, 0), min(own1 + overlap, height), own0, own1))
+    return tasks
+
+def lookup_dots_banded(centers, layout, width, band_rows=64):
+    """
+    점 중심 목록 -> 셀 배열. 셀 줄 band_rows개씩 해당 세로 구간만의 점유 마스크로 조회해
+    이미지 전체 크기 마스크를 만들지 않음.
+    """
+    centers = centers[np.argsort(centers[:, 1], kind='stable')]
+    r = layout.dot_r
+    hits = []
+    for row0 in range(0, layout.nrow, band_rows):
+        band = layout._replace(
+            origin_y=layout.origin_y + row0 * layout.cell_pitch_y,
+            nrow=min(band_rows, layout.nrow - row0),
+        )
+        cx, cy = layout_dot_positions(band)
+        top = int(cy.min()) - r
+        bottom = int(cy.max()) + r + 1
+        lo, hi = np.searchsorted(centers[:, 1], [top, bottom])
+        mask = dot_occupancy_mask(centers[lo:hi] - (0, top), (bottom - top, width), r)
+        hits.append(lookup_dots(mask, cx, cy - top, r))
+    if not hits:
+        return b''
+    return hits_to_cells(np.concatenate(hits))
+
+def decode_cells_tiled(
+    path,
+    geometry=None,
+    max_cols=20,
+    tile_height=4096,
+    workers=None,
+    verbose=False,
+):
+    """
+    메모리 매핑한 이미지를 타일 단위로 나눠 프로세스 풀에서 점 검출 후 셀 배열 복원.
+    - geometry 지정: 격자 원점 (0, 0)의 규격 이미지, 타일 경계를 셀 줄 경계에 맞춤
+    - geometry=None: 간격 추출 축소본으로 점 크기를 구하고, 병합한 점 중심으로 격자 배치 추정
+    """
+    img = open_image_memmap(path)
+    height, width = img.shape[:2]
+    if geometry is not None:
+        dot_r = geometry.point_r
+        tile_h = max(tile_height // geometry.cell_h, 1) * geometry.cell_h
+    else:
+        step = max(int(np.ceil(max(height, width) / 1024)), 1)
+        found = locate_braille_region(_to_gray(img[::step, ::step], path))
+        if found is None:
+            return b''
+        dot_r = found[1] * step
+        tile_h = tile_height
+    # 블러(5x5) 여유 + 점 지름만큼 겹쳐야 타일 경계에 걸친 점이 온전히 검출됨
+    overlap = int(np.ceil(3 * dot_r)) + 4
+    tasks = _tile_tasks(path, height, tile_h, overlap)
+    if verbose:
+        print(f"[DEBUG] 이미지 {height}x{width}, 타일 {len(tasks)}개 (높이 {tile_h}, 겹침 {overlap})")
+
+    if workers == 1 or len(tasks) == 1:
+        parts = [_detect_tile(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_detect_tile, tasks))
+    centers = np.concatenate([c for c, _ in parts]) if parts else np.empty((0, 2), np.int64)
+    radii = np.concatenate([r for _, r in parts]) if parts else np.empty(0)
+
+    if geometry is not None:
+        centers = centers[radii >= geometry.point_r * 0.7]
+        layout = grid_layout(geometry, height // geometry.cell_h, min(max_cols, width // geometry.cell_w))
+    else:
+        layout = estimate_grid_layout(centers, radii)
+        if layout is None:
+            return b''
+        centers = centers[radii >= layout.dot_r * 0.7]
+    if verbose:
+        print(f"[DEBUG] 검출된 점 개수: {len(centers)}, 격자: {layout}")
+    return lookup_dots_banded(centers, layout, width)
+
+def decode_braille_image_tiled(
+    img_path,
+    dpi=None,
+    max_cols=20,
+    cell_height_mm=10.0,
+    cell_width_mm=6.0,
+    dot_diameter_mm=1.5,
+    tile_height=4096,
+    workers=None,
+    verbose=False,
+):
+    """
+    초대형 점자 이미지(.npy / PGM / PPM) -> 텍스트. dpi=None 이면 격자 배치 자동 추정.
+    최대 메모리는 (타일 높이 x 너비) x 작업 프로세스 수 + 점 중심 목록 정도.
+    """
+    geometry = None
+    if dpi is not None:
+        geometry = cell_geometry(dpi, dot_diameter_mm, 2.5, cell_width_mm, cell_height_mm)
+    cells = decode_cells_tiled(img_path, geometry, max_cols, tile_height, workers, verbose)
+    return braille_to_text(cells, is_unicode=False)
@@ -1,234 +1,235 @@
 """
 한글/영문/숫자/약자/특수문자 텍스트 <-> 점자(6점식 유니코드/비트) 변환
-- 표준 braille_table.py (풀스펙) 연동
+- 매핑 테이블: data/braille_table.json을 컴파일한 바이너리 아티팩트(braille_table_compiler.py)를 mmap으로 로드
+- reload_tables()로 재시작 없이 테이블 교체 (진행 중인 변환은 시작 시점의 테이블로 끝까지 수행)
+- 셀 배열(cell array): 셀 1개 = 1바이트 6비트 마스크(점1=bit0 ... 점6=bit5)인 bytes
 """
 
-import hgtk
-from .braille_table import (
-    INITIAL_TO_BRAILLE, MEDIAL_TO_BRAILLE, FINAL_TO_BRAILLE,
-    HANGUL_BRAILLE_ABBREVIATION, ENGLISH_TO_BRAILLE,
-    CAPITAL_PREFIX, NUMBER_PREFIX, NUM_TO_BRAILLE_LETTER,
-    SPECIAL_TO_BRAILLE,
-    BRAILLE_TO_INITIAL, BRAILLE_TO_MEDIAL, BRAILLE_TO_FINAL,
-    BRAILLE_TO_HANGUL_ABBREVIATION, BRAILLE_TO_ENGLISH, BRAILLE_TO_SPECIAL,
-    BRAILLE_TO_CAPITAL_PREFIX, BRAILLE_TO_NUMBER_PREFIX
+from .braille_abbreviation import match_abbreviation
+from .braille_table_compiler import (
+    HANGUL_BASE, HANGUL_LAST, HANGUL_INITIALS, HANGUL_MEDIALS, HANGUL_FINALS,
+    bits_to_mask, load_tables,
 )
 
 def decompose_hangul(syllable):
     """한글 음절을 (초성, 중성, 종성) 분해. 아니면 (None, None, None) 반환."""
+    import hgtk
     try:
         cho, jung, jong = hgtk.letter.decompose(syllable)
         return cho, jung, jong
     except hgtk.exception.NotHangulException:
         return None, None, None
 
+def mask_to_bits(mask):
+    """셀 비트마스크 -> 6비트 리스트"""
+    return [(mask >> i) & 1 for i in range(6)]
+
 def assemble_braille_cell(bits):
     """6비트 리스트 -> 유니코드 점자 문자"""
-    code = 0
-    for i, bit in enumerate(bits):
-        if bit:
-            code |= (1 << i)
-    return chr(0x2800 + code)
-
-def text_to_braille(text, use_unicode=True):
-    """모든 한글/영문/숫자/특수/약자 텍스트 -> 점자(유니코드 or 비트 리스트) 변환"""
-    result = []
+    return chr(0x2800 + bits_to_mask(bits))
+
+# --- 셀 배열 <-> 유니코드 점자 변환표 (str.translate용) ---
+# 셀 배열(cell array): 셀 1개 = 1바이트 비트마스크인 bytes
+_MASK_TO_UNICODE = {m: chr(0x2800 + m) for m in range(64)}
+_UNICODE_TO_MASK = {0x2800 + m: chr(m & 0x3F) for m in range(256)}
+_UNICODE_TO_MASK[ord(' ')] = '\x00'
+
+def as_cell_array(cells):
+    """bytes/bytearray/uint8 배열 또는 6비트 리스트 시퀀스 -> 셀 배열(bytes)"""
+    if isinstance(cells, bytes):
+        return cells
+    if isinstance(cells, (bytearray, memoryview)):
+        return bytes(cells)
+    if hasattr(cells, 'astype'):  # numpy 배열
+        return cells.astype('uint8', copy=False).tobytes()
+    return bytes(bits_to_mask(c) if hasattr(c, '__len__') else int(c) for c in cells)
+
+def cells_to_unicode(cells):
+    """셀 배열 -> 유니코드 점자 문자열 (셀별 파이썬 루프 없이 0x2800 + mask)"""
+    return as_cell_array(cells).decode('latin-1').translate(_MASK_TO_UNICODE)
+
+def unicode_to_cells(braille):
+    """유니코드 점자 문자열 -> 셀 배열"""
+    try:
+        cells = braille.translate(_UNICODE_TO_MASK).encode('latin-1')
+    except UnicodeEncodeError:
+        cells = None
+    if cells is None or (cells and max(cells) > 0x3F):
+        raise ValueError("점자 유니코드(U+2800~U+28FF)가 아닌 문자가 포함되어 있습니다")
+    return cells
+
+# --- 변환/복원 테이블 (CompiledTables, 교체 단위) ---
+_TABLES = load_tables()
+
+def reload_tables(path=None):
+    """
+    점자 테이블 다시 로드 (path: .bin 아티팩트 또는 .json, 미지정 시 BRAILLE_TABLE 또는 기본 아티팩트).
+    새 테이블을 모두 읽은 뒤 한 번에 교체하므로 로드 실패 시 기존 테이블 유지. Returns: 새 테이블 버전
+    """
+    global _TABLES
+    _TABLES = load_tables(path)
+    return _TABLES.version
+
+def table_version():
+    """현재 테이블 버전 (정방향 매핑 내용 해시, 캐시 키 등에 사용)"""
+    return _TABLES.version
+
+def __getattr__(name):
+    # 하위 호환: 예전 모듈 전역 테이블을 현재 테이블에서 제공
+    if name == "ABBREVIATION_TRIE":
+        return _TABLES.abbreviation_trie
+    if name == "CAPITAL_PREFIX_MASK":
+        return _TABLES.capital_prefix_mask
+    if name == "NUMBER_PREFIX_MASK":
+        return _TABLES.number_prefix_mask
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _translate(text, final=True, tables=None):
+    """
+    텍스트 -> (셀 마스크 문자열, 변환한 글자 수). 약자 후보 사이 구간은 str.translate로 한 번에 변환.
+    final=False(스트리밍)이면 약자 판정에 뒤 문맥이 더 필요한 후보 위치에서 멈추고, 남은 글자는 호출자가 다음 청크와 이어 붙임.
+    """
+    tables = tables or _TABLES
+    table = tables.translate_table
+    if tables.abbreviation_start is None:
+        return text.translate(table), len(text)
+    trie = tables.abbreviation_trie
+    max_len = tables.max_abbreviation_len
+    parts = []
     i = 0
-    while i < len(text):
-        matched = False
+    n = len(text)
+    search = tables.abbreviation_start.search
+    while i < n:
+        m = search(text, i)
+        if m is None:
+            parts.append(text[i:].translate(table))
+            i = n
+            break
+        j = m.start()
+        if j > i:
+            parts.append(text[i:j].translate(table))
+        i = j
+        if not final and n - j < max_len:
+            break
         # 한글 약자(최장매칭)
-        for key in sorted(HANGUL_BRAILLE_ABBREVIATION.keys(), key=len, reverse=True):
-            if text[i:i+len(key)] == key:
-                bits = HANGUL_BRAILLE_ABBREVIATION[key]
-                # 약자값이 셀 2개 이상(겹받침/복합)일 경우
-                if isinstance(bits[0], list):
-                    for b in bits:
-                        result.append(assemble_braille_cell(b) if use_unicode else b)
-                else:
-                    result.append(assemble_braille_cell(bits) if use_unicode else bits)
-                i += len(key)
-                matched = True
-                break
-        if matched:
-            continue
-
-        ch = text[i]
-        cho, jung, jong = decompose_hangul(ch)
-        if cho is not None:
-            if cho in INITIAL_TO_BRAILLE:
-                b = INITIAL_TO_BRAILLE[cho]
-                result.append(assemble_braille_cell(b) if use_unicode else b)
-            if jung in MEDIAL_TO_BRAILLE:
-                b = MEDIAL_TO_BRAILLE[jung]
-                result.append(assemble_braille_cell(b) if use_unicode else b)
-            if jong is not None and jong in FINAL_TO_BRAILLE:
-                bits = FINAL_TO_BRAILLE[jong]
-                # 겹받침(2셀 이상)
-                if isinstance(bits[0], list):
-                    for b in bits:
-                        result.append(assemble_braille_cell(b) if use_unicode else b)
-                else:
-                    result.append(assemble_braille_cell(bits) if use_unicode else bits)
-            i += 1
-            continue
-
-        # 영문자 (대소문자/숫자 구분)
-        if ch.isalpha():
-            if ch.isupper():
-                if use_unicode:
-                    result.append(assemble_braille_cell(CAPITAL_PREFIX))
-                else:
-                    result.append(CAPITAL_PREFIX)
-            lower = ch.lower()
-            if lower in ENGLISH_TO_BRAILLE:
-                b = ENGLISH_TO_BRAILLE[lower]
-                result.append(assemble_braille_cell(b) if use_unicode else b)
-            else:
-                result.append(assemble_braille_cell([0,0,0,0,0,0]) if use_unicode else [0]*6)
-            i += 1
-            continue
-
-        # 숫자
-        if ch.isdigit():
-            if use_unicode:
-                result.append(assemble_braille_cell(NUMBER_PREFIX))
-            else:
-                result.append(NUMBER_PREFIX)
-            for digit in ch:
-                letter = NUM_TO_BRAILLE_LETTER[digit]
-                b = ENGLISH_TO_BRAILLE[letter]
-                result.append(assemble_braille_cell(b) if use_unicode else b)
-            i += 1
-            continue
-
-        # 특수문자
-        if ch in SPECIAL_TO_BRAILLE:
-            b = SPECIAL_TO_BRAILLE[ch]
-            result.append(assemble_braille_cell(b) if use_unicode else b)
-            i += 1
-            continue
-
-        # 공백
-        if ch.isspace():
-            result.append(assemble_braille_cell([0,0,0,0,0,0]) if use_unicode else [0]*6)
-            i += 1
-            continue
+        abbr = match_abbreviation(trie, text, j)
+        if abbr is None:
+            parts.append(text[j].translate(table))
+            i = j + 1
+        else:
+            length, cells = abbr
+            parts.append(cells)
+            i = j + length
+    return ''.join(parts), i
 
-        # 정의되지 않은 문자
-        result.append(assemble_braille_cell([0,0,0,0,0,0]) if use_unicode else [0]*6)
-        i += 1
+def text_to_braille(text, use_unicode=True):
+    """모든 한글/영문/숫자/특수/약자 텍스트 -> 점자(유니코드 문자열 or 셀 배열) 변환"""
+    cells, _ = _translate(text)
     # Unicode 점자일 경우, 셀 사이를 공백 없이 반환
     if use_unicode:
-        return ''.join(result)
-    return result
+        return cells.translate(_MASK_TO_UNICODE)
+    return cells.encode('latin-1')
+
+def iter_text_to_braille(chunks, use_unicode=True, chunk_size=1 << 20):
+    """
+    텍스트 청크 스트림 -> 점자 청크 제너레이터 (유니코드 문자열 or 셀 배열)
+    - chunks: 텍스트 파일 객체(chunk_size 글자씩 읽음) 또는 문자열 iterable
+    - 청크 경계에 걸친 약자도 전체 텍스트를 한 번에 변환한 결과와 동일하게 변환
+    - 메모리 사용량은 청크 크기 + 최대 약자 길이로 제한
+    """
+    if hasattr(chunks, 'read'):
+        reader = chunks
+        chunks = iter(lambda: reader.read(chunk_size), '')
+    convert = (lambda c: c.translate(_MASK_TO_UNICODE)) if use_unicode else (lambda c: c.encode('latin-1'))
+    tables = _TABLES  # 스트림 도중 테이블이 교체되어도 같은 테이블로 변환
+    pending = ''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = pending + chunk
+        cells, consumed = _translate(text, final=False, tables=tables)
+        pending = text[consumed:]
+        if cells:
+            yield convert(cells)
+    if pending:
+        cells, _ = _translate(pending, tables=tables)
+        yield convert(cells)
+
+def translate_file(src_path, dst_path, use_unicode=True, chunk_size=1 << 20, encoding='utf-8'):
+    """
+    텍스트 파일 -> 점자 파일 (일정한 메모리로 청크 단위 변환)
+    - use_unicode=True: UTF-8 유니코드 점자 텍스트, False: 셀 배열 바이너리(셀당 1바이트)
+    Returns: 변환된 셀 개수
+    """
+    ncell = 0
+    with open(src_path, encoding=encoding, newline='') as src:
+        if use_unicode:
+            dst = open(dst_path, 'w', encoding='utf-8', newline='')
+        else:
+            dst = open(dst_path, 'wb')
+        with dst:
+            for chunk in iter_text_to_braille(src, use_unicode, chunk_size):
+                dst.write(chunk)
+                ncell += len(chunk)
+    return ncell
 
 def parse_to_braille_cells(text):
-    """텍스트를 점자 6비트 배열 리스트로 변환"""
+    """텍스트를 점자 셀 배열(bytes, 셀당 6비트 마스크)로 변환"""
     return text_to_braille(text, use_unicode=False)
 
 def braille_to_text(braille, is_unicode=True):
-    """점자(유니코드 문자열 or 6비트 리스트) -> 원문 텍스트 복원"""
-    result = []
-    cells = []
-    # 유니코드 점자라면 문자별 6비트 추출
-    if is_unicode:
-        for c in braille:
-            code = ord(c) - 0x2800
-            bits = [(code>>i)&1 for i in range(6)]
-            cells.append(bits)
-    else:
-        cells = braille
+    """점자(유니코드 문자열 or 셀 배열) -> 원문 텍스트 복원 (셀 수에 선형, 셀당 테이블 조회만 수행)"""
+    cells = unicode_to_cells(braille) if is_unicode else as_cell_array(braille)
+    tables = _TABLES
+    abbreviation = tables.decode_abbreviation
+    syllable_base = tables.decode_syllable_base
+    final_offset = tables.decode_final_offset
+    capital = tables.decode_capital
+    digit = tables.decode_digit
+    single = tables.decode_single
+    capital_prefix = tables.capital_prefix_mask
+    number_prefix = tables.number_prefix_mask
 
+    result = []
+    append = result.append
     i = 0
     n = len(cells)
     while i < n:
-        # 1. 한글 약자/약어(최장매칭)
-        abbr_matched = False
-        for k, v in BRAILLE_TO_HANGUL_ABBREVIATION.items():
-            abbr_len = len(k) if isinstance(k, tuple) and isinstance(k[0], tuple) else 1
-            if abbr_len == 1 and tuple(cells[i]) == k:
-                result.append(v)
-                i += 1
-                abbr_matched = True
-                break
-            elif abbr_len > 1 and tuple(cells[i:i+abbr_len]) == k:
-                result.append(v)
-                i += abbr_len
-                abbr_matched = True
-                break
-        if abbr_matched:
+        c = cells[i]
+        # 1. 한글 약자/약어
+        abbr = abbreviation[c]
+        if abbr is not None:
+            append(abbr)
+            i += 1
             continue
 
-        # 2. 한글(초/중/종)
+        # 2. 한글(초/중/종) - 겹받침은 다음 글자 초성과 구분할 수 없어 단일 셀 종성만 복원
         if i+2 < n:
-            ini = BRAILLE_TO_INITIAL.get(tuple(cells[i]), None)
-            med = BRAILLE_TO_MEDIAL.get(tuple(cells[i+1]), None)
-            jong = ''
-            next_is_complex = False
-            for key, val in BRAILLE_TO_FINAL.items():
-                if isinstance(key, tuple) and isinstance(key[0], tuple) and tuple(cells[i+2:i+2+len(key)]) == key:
-                    jong = val
-                    next_is_complex = True
-                    break
-            if not next_is_complex:
-                jong = BRAILLE_TO_FINAL.get(tuple(cells[i+2]), '')
-            if ini and med is not None:
-                try:
-                    char = hgtk.letter.compose(ini, med, jong)
-                except Exception:
-                    char = '?'
-                result.append(char)
-                i += 2 + (len(key) if next_is_complex else 1)
+            base = syllable_base[(c << 6) | cells[i+1]]
+            if base:
+                append(chr(base + final_offset[cells[i+2]]))
+                i += 3
                 continue
 
         # 3. 영문 대문자 prefix
-        if tuple(cells[i]) == BRAILLE_TO_CAPITAL_PREFIX:
-            if i+1 < n:
-                ch = BRAILLE_TO_ENGLISH.get(tuple(cells[i+1]), '?')
-                result.append(ch.upper())
-                i += 2
-                continue
-
-        # 4. 숫자 prefix
-        if tuple(cells[i]) == BRAILLE_TO_NUMBER_PREFIX:
-            num = []
-            idx = i + 1
-            while idx < n:
-                digit_ch = BRAILLE_TO_ENGLISH.get(tuple(cells[idx]), None)
-                if digit_ch and digit_ch in NUM_TO_BRAILLE_LETTER.values():
-                    for k, v in NUM_TO_BRAILLE_LETTER.items():
-                        if v == digit_ch:
-                            num.append(k)
-                            break
-                else:
-                    break
-                idx += 1
-            result.append(''.join(num))
-            i = idx
-            continue
-
-        # 5. 영문자
-        ch = BRAILLE_TO_ENGLISH.get(tuple(cells[i]), None)
-        if ch:
-            result.append(ch)
-            i += 1
-            continue
-
-        # 6. 특수문자
-        spec = BRAILLE_TO_SPECIAL.get(tuple(cells[i]), None)
-        if spec:
-            result.append(spec)
-            i += 1
+        if c == capital_prefix and i+1 < n:
+            append(capital[cells[i+1]])
+            i += 2
             continue
 
-        # 7. 공백
-        if cells[i] == [0,0,0,0,0,0]:
-            result.append(' ')
+        # 4. 숫자 prefix
+        if c == number_prefix:
             i += 1
+            while i < n:
+                d = digit[cells[i]]
+                if d is None:
+                    break
+                append(d)
+                i += 1
             continue
 
-        # 8. 기타
-        result.append('?')
+        # 5~8. 영문자 / 특수문자 / 공백 / 기타
+        append(single[c])
         i += 1
     return ''.join(result)
 